@@ -85,6 +85,11 @@ from typing import Dict, List, Optional, Tuple, Any
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+# Shared utilities; the repo root is put on the path so the script also
+# runs directly (python aws/<script>.py) without PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.cli_utils import handle_error
+
 # Command-specific constants
 PERIODS = [
     ("Day Before Yesterday", -2),
@@ -108,17 +113,6 @@ DEFAULT_GROUP = "ALL"
 DEFAULT_METHOD = "all"
 MIN_DATA_POINTS = 10
 
-def handle_error(message: str, exit_code: int = 1) -> None:
-    """
-    Print error message and exit with specified code.
-    
-    Args:
-        message: Error message to display
-        exit_code: Exit code to use
-    """
-    print(f"Error: {message}", file=sys.stderr)
-    sys.exit(exit_code)
-
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser for this command."""
     parser = argparse.ArgumentParser(
@@ -245,6 +239,37 @@ def run_forecast_costs(df: pd.DataFrame, metric: str, method: str) -> Optional[p
         return None
     return pd.read_csv(io.StringIO(result.stdout))
 
+def index_forecasts_by_date(forecast_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index forecast output by parsed PeriodStart for repeated date lookups.
+    
+    Args:
+        forecast_df: DataFrame produced by forecast_costs.py
+        
+    Returns:
+        DataFrame indexed by PeriodStart (first row kept for duplicate dates)
+    """
+    indexed = forecast_df.assign(PeriodStart=pd.to_datetime(forecast_df['PeriodStart'], errors='coerce'))
+    indexed = indexed.dropna(subset=['PeriodStart']).drop_duplicates('PeriodStart')
+    return indexed.set_index('PeriodStart')
+
+def lookup_forecast_values(indexed_df: pd.DataFrame, method: str, lookup_dates: pd.DatetimeIndex) -> List[Optional[float]]:
+    """
+    Fetch a method's forecast for several dates with a single indexed lookup.
+    
+    Args:
+        indexed_df: Forecast DataFrame returned by index_forecasts_by_date
+        method: Forecast column name
+        lookup_dates: Dates to look up
+        
+    Returns:
+        List of values aligned with lookup_dates (None where missing or NaN)
+    """
+    if method not in indexed_df.columns:
+        return [None] * len(lookup_dates)
+    values = indexed_df[method].reindex(lookup_dates).to_numpy()
+    return [None if pd.isna(v) else v for v in values]
+
 def percent_diff(a: Any, b: Any) -> Optional[float]:
     """
     Calculate percentage difference between two values.
@@ -295,6 +320,12 @@ def main() -> None:
     methods = METHODS if args.method == 'all' else [args.method]
     summary_rows = []
 
+    # Yesterday's forecast followed by the comparison date for each period
+    target_date = dates["YESTERDAY"]
+    lookup_dates = pd.DatetimeIndex(
+        [target_date] + [target_date + timedelta(days=offset) for _, offset in PERIODS]
+    )
+
     print(f"Anomaly Detection Report (Forecast, Threshold: {args.threshold}%)")
     print(f"Comparing yesterday's forecast to previous periods for each group and method.")
 
@@ -320,14 +351,9 @@ def main() -> None:
                 available_cols = set(forecast_df.columns)
                 methods = [m for m in METHODS if m in available_cols]
             # Get forecasted values for each date
-            for label, offset in PERIODS:
-                target_date = dates["YESTERDAY"]
-                prev_date = dates["YESTERDAY"] + timedelta(days=offset)
-                try:
-                    yest_val = forecast_df.loc[forecast_df['PeriodStart'] == pd.Timestamp(target_date), method].values[0]
-                    prev_val = forecast_df.loc[forecast_df['PeriodStart'] == pd.Timestamp(prev_date), method].values[0]
-                except Exception:
-                    yest_val = prev_val = None
+            indexed_df = index_forecasts_by_date(forecast_df)
+            yest_val, *prev_vals = lookup_forecast_values(indexed_df, method, lookup_dates)
+            for (label, _), prev_val in zip(PERIODS, prev_vals):
                 diff = percent_diff(yest_val, prev_val)
                 anomaly = 'N'
                 if diff is not None and abs(diff) > args.threshold:
@@ -86,7 +86,9 @@ from typing import Optional, Dict, Any, List, Tuple
 # Third-party imports second
 import pandas as pd
 
-# Shared utilities
+# Shared utilities; the repo root is put on the path so the script also
+# runs directly (python aws/<script>.py) without PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common.cli_utils import handle_error, write_csv_output, write_json_output
 
 # Command-specific constants
@@ -7,13 +7,24 @@ from typing import Any, Dict
 
 def handle_error(message: str, exit_code: int = 1) -> None:
     """Print error message and exit with specified code."""
-    print(f"Error: {message}", file=sys.stderr)
-    sys.exit(exit_code)
+    sys.stderr.write(f"Error: {message}\n")
+    raise SystemExit(exit_code)
 
 
 def write_csv_output(df, include_header: bool = True) -> None:
-    """Write DataFrame as CSV to stdout."""
-    df.to_csv(sys.stdout, index=False, header=include_header)
+    """Write DataFrame as CSV to stdout.
+
+    Bytes go straight to the binary stdout buffer when there is one,
+    skipping the text wrapper's encoding layer.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        df.to_csv(sys.stdout, index=False, header=include_header)
+        return
+    # Flush pending text first so output stays in order
+    sys.stdout.flush()
+    df.to_csv(buffer, index=False, header=include_header, mode="wb")
+    buffer.flush()
 
 
 def write_json_output(data: Dict[str, Any], indent: int = 2) -> None:
@@ -11,26 +11,84 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 
+# pyarrow infers column types from the first block of this many bytes
+ARROW_INFERENCE_BYTES = 1 << 20
+
+
+def _arrow_reformats_columns(source) -> bool:
+    """Whether pyarrow would rewrite any column's text on a CSV round trip.
+
+    pyarrow parses timestamp- and time-looking strings that the C engine keeps
+    as written, so "2024-01-01T00:00:00Z" would be written back as
+    "2024-01-01 00:00:00+00:00". Plain YYYY-MM-DD dates print back unchanged.
+    The check infers the schema of the first block only.
+    """
+    import io
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    if hasattr(source, "read"):
+        head = source.read(ARROW_INFERENCE_BYTES)
+        source.seek(0)
+    else:
+        with open(source, "rb") as f:
+            head = f.read(ARROW_INFERENCE_BYTES)
+    if len(head) == ARROW_INFERENCE_BYTES:
+        # Drop the partial last line
+        head = head[: head.rfind(b"\n") + 1]
+    try:
+        schema = pa_csv.read_csv(io.BytesIO(head)).schema
+    except (pa.ArrowInvalid, ValueError):
+        return True
+    return any(pa.types.is_timestamp(t) or pa.types.is_time(t) for t in schema.types)
+
+
 def read_input_csv(path: Optional[str]) -> pd.DataFrame:
-    """Read a CSV file or stdin into a DataFrame."""
+    """Read a CSV file or stdin into a DataFrame.
+
+    Parses with the multi-threaded pyarrow engine when pyarrow is installed
+    and would not reformat any column (see _arrow_reformats_columns), falling
+    back to the C engine otherwise or when pyarrow rejects the input. Tools
+    write unmodified columns back out, so both engines must give the same text.
+    """
+    import io
     import sys
 
     if path:
-        return pd.read_csv(path)
-    return pd.read_csv(sys.stdin)
+        source = path
+    elif hasattr(sys.stdin, "buffer"):
+        # Buffer stdin so the C engine can re-read it if pyarrow fails
+        source = io.BytesIO(sys.stdin.buffer.read())
+    else:
+        return pd.read_csv(sys.stdin)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.read_csv(source)
+    if _arrow_reformats_columns(source):
+        return pd.read_csv(source)
+    try:
+        return pd.read_csv(source, engine="pyarrow")
+    except ValueError:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return pd.read_csv(source)
 
 
 def write_output_csv(df: pd.DataFrame, path: Optional[str]) -> None:
     """Write a DataFrame to a CSV file or stdout."""
-    import sys
+    from common.cli_utils import write_csv_output
 
     if path:
         df.to_csv(path, index=False)
     else:
-        df.to_csv(sys.stdout, index=False)
+        write_csv_output(df)
 
 
 def ensure_datetime_column(df: pd.DataFrame, date_column: str) -> pd.DataFrame:
@@ -38,8 +96,15 @@ def ensure_datetime_column(df: pd.DataFrame, date_column: str) -> pd.DataFrame:
     if date_column not in df.columns:
         raise SystemExit(f"Missing date column: {date_column}")
 
-    dates = pd.to_datetime(df[date_column], errors="coerce")
-    if dates.isna().any():
+    column = df[date_column]
+    if pd.api.types.is_datetime64_any_dtype(column):
+        # Already parsed (e.g. by an earlier transform): only check for NaT
+        if column.isna().to_numpy().any():
+            raise SystemExit(f"Invalid dates found in column {date_column}")
+        return df
+
+    dates = pd.to_datetime(column, errors="coerce")
+    if dates.isna().to_numpy().any():
         raise SystemExit(f"Invalid dates found in column {date_column}")
     df = df.copy()
     df[date_column] = dates
@@ -64,18 +129,25 @@ def mask_fixed_window_from_start(
     Boolean mask selecting the first `length` rows with date >= start_date.
 
     Works for both daily and monthly series, regardless of gaps, by selecting
-    based on sorted dates, not assumed frequency.
+    based on sorted dates, not assumed frequency. Frames sorted with
+    sort_by_date locate the window with a binary search.
     """
     if length <= 0:
         raise SystemExit("--length must be >= 1")
 
     start = pd.to_datetime(start_date)
-    eligible = df[df[date_column] >= start]
-    if eligible.empty:
+    dates = df[date_column]
+    if dates.is_monotonic_increasing:
+        first = int(dates.searchsorted(start, side="left"))
+        positions = np.arange(first, min(first + length, len(df)))
+    else:
+        positions = np.flatnonzero((dates >= start).to_numpy())[:length]
+    if positions.size == 0:
         raise SystemExit("No rows found at or after the specified start date")
 
-    window_index = eligible.index[:length]
-    return df.index.isin(window_index)
+    mask = np.zeros(len(df), dtype=bool)
+    mask[positions] = True
+    return pd.Series(mask, index=df.index)
 
 
 def apply_pct_or_value_change(
@@ -98,18 +170,21 @@ def apply_pct_or_value_change(
     if value_column not in df.columns:
         raise SystemExit(f"Missing value column: {value_column}")
 
-    out = df.copy()
-    series = out[value_column].astype(float)
+    # Work on one float64 copy of the value column; the rest of the frame is
+    # shared with the input through a shallow copy
+    values = df[value_column].to_numpy(dtype=float, copy=True)
+    selected = np.asarray(mask, dtype=bool)
 
     if pct is not None:
-        series.loc[mask] = series.loc[mask] * (1.0 + pct)
+        np.multiply(values, 1.0 + pct, out=values, where=selected)
     else:
-        series.loc[mask] = series.loc[mask] + value  # type: ignore[arg-type]
+        np.add(values, value, out=values, where=selected)
 
     if clamp_non_negative:
-        series = series.clip(lower=0.0)
+        np.maximum(values, 0.0, out=values)
 
-    out[value_column] = series
+    out = df.copy(deep=False)
+    out[value_column] = values
     return out
 
 
@@ -132,22 +207,24 @@ def append_note_for_first_masked_row(
     if date_column not in df.columns:
         raise SystemExit(f"Missing date column: {date_column}")
 
-    out = df.copy()
-    if "note" not in out.columns:
-        out["note"] = ""
-
-    masked_rows = out[mask]
-    if masked_rows.empty:
-        # Nothing to annotate; return unchanged
-        return out
-
-    first_idx = masked_rows.index.min()
-    existing = out.at[first_idx, "note"]
-    if pd.isna(existing) or existing == "":
-        out.at[first_idx, "note"] = note
+    # Only the note column is rebuilt; other columns are shared through a
+    # shallow copy
+    if "note" in df.columns:
+        notes = df["note"].to_numpy(dtype=object, copy=True)
     else:
-        out.at[first_idx, "note"] = f"{existing}\n{note}"
-
+        notes = np.full(len(df), "", dtype=object)
+    out = df.copy(deep=False)
+
+    positions = np.flatnonzero(np.asarray(mask, dtype=bool))
+    if positions.size:
+        first = positions[0]
+        existing = notes[first]
+        if pd.isna(existing) or existing == "":
+            notes[first] = note
+        else:
+            notes[first] = f"{existing}\n{note}"
+
+    out["note"] = notes
     return out
 
 
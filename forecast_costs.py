@@ -50,6 +50,8 @@ Output Format:
     - neural_prophet: Forecasted value using NeuralProphet (if --neural-prophet flag used and neuralprophet installed)
     - darts: Forecasted value using Darts algorithm (if --darts-algorithm specified and darts installed)
     - ensemble: Ensemble forecast (average of all available forecasts, if --ensemble flag used)
+    With --output-format json, the same rows are emitted as a JSON document under
+    "forecast", with the milestone summary (if requested) under "milestone_summary".
 
 Error Handling:
     - Exit code 1: Invalid arguments, data processing errors
@@ -74,6 +76,9 @@ Examples:
     
     # With milestone summary
     python forecast_costs.py --input costs.csv --date-column PeriodStart --value-column Cost --milestone-summary
+    
+    # One forecast per service, fitted in parallel
+    python forecast_costs.py --input costs.csv --date-column PeriodStart --value-column Cost --group-column Service
 
 Author: Frank Contrepois
 License: MIT
@@ -81,20 +86,31 @@ License: MIT
 
 # Standard library imports first
 import argparse
+import calendar
+import contextlib
+import hashlib
+import json
+import logging
 import os
 import sys
 import warnings
-from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
 from typing import Optional, Dict, Any, List, Tuple
 
 # Third-party imports second
 import numpy as np
 import pandas as pd
 
+# Shared utilities
+from common.cli_utils import handle_error, write_csv_output
+
 # Command-specific constants
 MIN_DATA_POINTS = 10
 DEFAULT_SMA_WINDOW = 7
 DEFAULT_ES_ALPHA = 0.5
+DEFAULT_ES_MODEL = 'simple'
+ES_MODELS = ['simple', 'holt', 'holt-winters']
 DEFAULT_HW_ALPHA = 0.3
 DEFAULT_HW_BETA = 0.1
 DEFAULT_HW_GAMMA = 0.1
@@ -102,20 +118,61 @@ DEFAULT_HW_SEASONAL_PERIODS = 12
 DEFAULT_ARIMA_ORDER = (1, 1, 1)
 DEFAULT_SARIMA_ORDER = (1, 1, 1)
 DEFAULT_SARIMA_SEASONAL_ORDER = (1, 1, 1, 12)
+# Default order strings as they arrive from the CLI, mapped to their parsed
+# tuples so the common case skips parsing entirely.
+DEFAULT_ORDER_STRINGS = {
+    ','.join(map(str, order)): order
+    for order in (DEFAULT_ARIMA_ORDER, DEFAULT_SARIMA_ORDER, DEFAULT_SARIMA_SEASONAL_ORDER)
+}
 DEFAULT_THETA_METHOD = 2
+DARTS_ALGORITHMS = ['exponential_smoothing', 'arima', 'auto_arima', 'theta', 'linear_regression', 'random_forest', 'xgboost']
 DEFAULT_PROPHET_CHANGEPOINT_PRIOR_SCALE = 0.05
 DEFAULT_PROPHET_SEASONALITY_PRIOR_SCALE = 10.0
+DEFAULT_PROPHET_UNCERTAINTY_SAMPLES = 0
+DEFAULT_PROPHET_N_CHANGEPOINTS = 25
+DEFAULT_PRECISION = 'fp64'
+DEFAULT_OUTPUT_FORMAT = 'csv'
+PRECISION_DTYPES = {'fp32': np.float32, 'fp64': np.float64}
+FORECAST_COLUMNS = ['sma', 'es', 'hw', 'arima', 'sarima', 'theta', 'prophet', 'neural_prophet', 'darts', 'ensemble']
+CACHE_DIR_ENV = 'FORECAST_CACHE_DIR'
+# Set to any non-empty value to disable every on-disk cache, like --no-cache
+NO_CACHE_ENV = 'FORECAST_NO_CACHE'
+DEFAULT_CACHE_DIR = os.path.join('~', '.cache', 'finops-toolkit')
+LOAD_CACHE_VERSION = 1
+# Parsed inputs kept in the load cache; the least recently used are evicted
+LOAD_CACHE_MAX_ITEMS = 64
+# Bump to invalidate memoized model forecasts after changing how they are fitted
+FORECAST_CACHE_VERSION = 1
+FORECAST_CACHE_MAX_ITEMS = 512
+STDIN_CHUNKSIZE = 200_000
+NUMBA_MIN_POINTS = 10_000
+# Series whose range is below this fraction of their level count as flat
+CONSTANT_SERIES_RTOL = 1e-12
+# Prophet, ARIMA, SARIMA, NeuralProphet and Darts each get a worker thread
+MAX_FORECAST_THREADS = 5
+
+# Model libraries whose warnings the CLI silences (see quiet_model_libraries)
+QUIET_WARNING_MODULES = ['prophet', 'cmdstanpy', 'neuralprophet', 'torch', 'pytorch_lightning', 'lightning']
+
+# Lazily compiled numba kernels by function name (False: numba unavailable)
+_numba_kernels: Dict[str, Any] = {}
 
-def handle_error(message: str, exit_code: int = 1) -> None:
+def quiet_model_libraries() -> None:
     """
-    Print error message and exit with specified code.
+    Silence model-library warnings and cmdstanpy's progress logs for a CLI run.
     
-    Args:
-        message: Error message to display
-        exit_code: Exit code to use
+    Model fits run in worker threads next to the other forecasters, where a
+    per-call warnings.catch_warnings() would also silence them, so warnings are
+    filtered by module, once. This changes process-wide state, so only main()
+    and the group worker processes call it, never a plain import.
     """
-    print(f"Error: {message}", file=sys.stderr)
-    sys.exit(exit_code)
+    for module in QUIET_WARNING_MODULES:
+        warnings.filterwarnings("ignore", module=module)
+    
+    # cmdstanpy logs every Stan chain start and finish at INFO through a stderr
+    # handler it installs on first use unless the logger already has one
+    logging.getLogger('cmdstanpy').addHandler(logging.NullHandler())
+    logging.getLogger('cmdstanpy').setLevel(logging.ERROR)
 
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser for this command."""
@@ -135,6 +192,9 @@ Examples:
     
     # With milestone summary
     python forecast_costs.py --input costs.csv --date-column PeriodStart --value-column Cost --milestone-summary
+    
+    # One forecast per service, fitted in parallel
+    python forecast_costs.py --input costs.csv --date-column PeriodStart --value-column Cost --group-column Service
         """
     )
     
@@ -155,6 +215,10 @@ Examples:
         '--input', 
         help='Input CSV file. If omitted, reads from stdin.'
     )
+    parser.add_argument(
+        '--group-column', 
+        help='Forecast each value of this column (e.g., Service) as a separate series, in parallel processes'
+    )
     parser.add_argument(
         '--sma-window', 
         type=int, 
@@ -167,6 +231,13 @@ Examples:
         default=DEFAULT_ES_ALPHA, 
         help=f'Alpha for Exponential Smoothing (default: {DEFAULT_ES_ALPHA})'
     )
+    parser.add_argument(
+        '--es-model', 
+        choices=ES_MODELS, 
+        default=DEFAULT_ES_MODEL, 
+        help=f'Exponential Smoothing model (default: {DEFAULT_ES_MODEL}). holt and holt-winters fit '
+             'their parameters with statsmodels (requires ENABLE_STATSMODELS) and ignore --es-alpha.'
+    )
     parser.add_argument(
         '--hw-alpha', 
         type=float, 
@@ -194,19 +265,19 @@ Examples:
     parser.add_argument(
         '--arima-order', 
         type=str, 
-        default='1,1,1', 
+        default=','.join(map(str, DEFAULT_ARIMA_ORDER)), 
         help='ARIMA order as comma-separated values (p,d,q) (default: 1,1,1)'
     )
     parser.add_argument(
         '--sarima-order', 
         type=str, 
-        default='1,1,1', 
+        default=','.join(map(str, DEFAULT_SARIMA_ORDER)), 
         help='SARIMA order as comma-separated values (p,d,q) (default: 1,1,1)'
     )
     parser.add_argument(
         '--sarima-seasonal-order', 
         type=str, 
-        default='1,1,1,12', 
+        default=','.join(map(str, DEFAULT_SARIMA_SEASONAL_ORDER)), 
         help='SARIMA seasonal order as comma-separated values (P,D,Q,s) (default: 1,1,1,12)'
     )
     parser.add_argument(
@@ -228,7 +299,7 @@ Examples:
     parser.add_argument(
         '--darts-algorithm', 
         type=str, 
-        choices=['exponential_smoothing', 'arima', 'auto_arima', 'theta', 'linear_regression', 'random_forest', 'xgboost'],
+        choices=DARTS_ALGORITHMS,
         help='Include Darts forecast with specified algorithm (requires u8darts). Install with: pip install u8darts'
     )
     parser.add_argument(
@@ -261,6 +332,52 @@ Examples:
         default=DEFAULT_PROPHET_SEASONALITY_PRIOR_SCALE, 
         help=f'Prophet seasonality prior scale (default: {DEFAULT_PROPHET_SEASONALITY_PRIOR_SCALE})'
     )
+    parser.add_argument(
+        '--prophet-uncertainty-samples', 
+        type=int, 
+        default=DEFAULT_PROPHET_UNCERTAINTY_SAMPLES, 
+        help=f'Prophet posterior samples for uncertainty intervals (default: {DEFAULT_PROPHET_UNCERTAINTY_SAMPLES}). '
+             'Only yhat is reported, so sampling is off unless requested.'
+    )
+    parser.add_argument(
+        '--prophet-n-changepoints', 
+        type=int, 
+        default=DEFAULT_PROPHET_N_CHANGEPOINTS, 
+        help=f'Prophet potential trend changepoints (default: {DEFAULT_PROPHET_N_CHANGEPOINTS}). '
+             'Fewer changepoints make the fit faster on short series.'
+    )
+    parser.add_argument(
+        '--precision', 
+        choices=sorted(PRECISION_DTYPES), 
+        default=DEFAULT_PRECISION, 
+        help=f'Floating point precision used to hold the value column (default: {DEFAULT_PRECISION}). '
+             'fp32 halves memory traffic for SMA/ES on long series; Prophet always fits in fp64.'
+    )
+    
+    parser.add_argument(
+        '--output-format', 
+        choices=['csv', 'json'], 
+        default=DEFAULT_OUTPUT_FORMAT, 
+        help=f'Output format (default: {DEFAULT_OUTPUT_FORMAT}). json emits one document with the forecast rows and, if requested, the milestone summary.'
+    )
+    parser.add_argument(
+        '--jobs', 
+        type=int, 
+        default=None, 
+        help=f'Maximum number of model fits running at once (default: {MAX_FORECAST_THREADS}, or one per CPU '
+             'with --group-column, where the budget is split between group processes and their fits). '
+             '1 runs everything serially.'
+    )
+    parser.add_argument(
+        '--no-cache', 
+        action='store_true', 
+        help=f'Do not read or write the parsed-input and model forecast caches (stored in ${CACHE_DIR_ENV}, default: {DEFAULT_CACHE_DIR}; also disabled by setting ${NO_CACHE_ENV})'
+    )
+    parser.add_argument(
+        '--no-prophet-cache', 
+        action='store_true', 
+        help='Always refit Prophet instead of reusing a memoized forecast (the input cache is still used)'
+    )
     
     # Boolean flags
     parser.add_argument(
@@ -271,12 +388,43 @@ Examples:
     
     return parser
 
-def read_input_from_file(filepath: str) -> pd.DataFrame:
+def read_csv_fast(source, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read CSV with the multi-threaded pyarrow engine, falling back to the C engine.
+    
+    The fallback covers a missing pyarrow install and anything the pyarrow
+    reader rejects (malformed input, absent usecols), so error reporting is
+    left to the C engine and to validate_required_columns.
+    
+    Args:
+        source: Path or seekable buffer to read
+        usecols: Columns to keep; others are skipped while parsing
+        
+    Returns:
+        pd.DataFrame: Parsed CSV data
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        try:
+            return pd.read_csv(source, engine='pyarrow', usecols=usecols)
+        except (ValueError, KeyError):
+            if hasattr(source, 'seek'):
+                source.seek(0)
+    if usecols is None:
+        return pd.read_csv(source)
+    wanted = set(usecols)
+    return pd.read_csv(source, usecols=lambda col: col in wanted)
+
+def read_input_from_file(filepath: str, usecols: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Read CSV data from file.
     
     Args:
         filepath: Path to the input CSV file
+        usecols: Columns to keep (default: all)
         
     Returns:
         pd.DataFrame: Parsed CSV data
@@ -288,17 +436,24 @@ def read_input_from_file(filepath: str) -> pd.DataFrame:
         handle_error(f"Input file '{filepath}' does not exist or is not a file.", 2)
     
     try:
-        df = pd.read_csv(filepath)
+        df = read_csv_fast(filepath, usecols)
         if df.empty:
             handle_error("Input file is empty.", 2)
         return df
     except Exception as e:
         handle_error(f"Failed to read input file: {e}", 2)
 
-def read_input_from_stdin() -> pd.DataFrame:
+def read_input_from_stdin(usecols: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Read CSV data from stdin.
     
+    The stream is parsed in chunks of STDIN_CHUNKSIZE rows and only the
+    projected columns of each chunk are kept, so piping a wide export does not
+    hold every column of the whole file in memory at once.
+    
+    Args:
+        usecols: Columns to keep (default: all)
+        
     Returns:
         pd.DataFrame: Parsed CSV data
         
@@ -309,7 +464,13 @@ def read_input_from_stdin() -> pd.DataFrame:
         handle_error("No input data provided via stdin.", 1)
     
     try:
-        df = pd.read_csv(sys.stdin)
+        if usecols is None:
+            reader = pd.read_csv(sys.stdin, chunksize=STDIN_CHUNKSIZE)
+        else:
+            wanted = set(usecols)
+            reader = pd.read_csv(sys.stdin, usecols=lambda col: col in wanted, chunksize=STDIN_CHUNKSIZE)
+        with reader:
+            df = pd.concat(list(reader), ignore_index=True)
         if df.empty:
             handle_error("Input data is empty.", 1)
         return df
@@ -331,10 +492,185 @@ def validate_required_columns(df: pd.DataFrame, required_columns: List[str]) ->
     if missing_columns:
         handle_error(f"Missing required columns: {', '.join(missing_columns)}", 3)
 
+def parse_date_column(values: pd.Series) -> pd.Series:
+    """
+    Parse a date column to datetime64, trying ISO 8601 first.
+    
+    cost_and_usage.py emits ISO 8601 dates, so the explicit format avoids
+    per-element format inference. Any value the ISO parser rejects is retried
+    with pandas' generic parser; values neither can parse become NaT.
+    
+    Args:
+        values: Raw date column
+        
+    Returns:
+        pd.Series: Parsed datetime column
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    dates = pd.to_datetime(values, format='ISO8601', errors='coerce', cache=True)
+    unparsed = dates.isna() & values.notna()
+    if unparsed.any():
+        dates[unparsed] = pd.to_datetime(values[unparsed], errors='coerce')
+    return dates
+
+def get_cache_dir() -> str:
+    """
+    Get the directory holding the tool's on-disk caches.
+    
+    Returns:
+        Expanded path from $FORECAST_CACHE_DIR, or ~/.cache/finops-toolkit
+    """
+    return os.path.expanduser(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+
+def caching_disabled(args) -> bool:
+    """
+    Check whether the on-disk caches are turned off for this run.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        True if --no-cache is set or $FORECAST_NO_CACHE is non-empty
+    """
+    return bool(getattr(args, 'no_cache', False) or os.environ.get(NO_CACHE_ENV))
+
+def get_forecast_memory(args):
+    """
+    Get the joblib Memory used to memoize expensive model fits.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        joblib.Memory, or None if caching is disabled or joblib is not installed
+    """
+    if caching_disabled(args):
+        return None
+    try:
+        from joblib import Memory
+    except ImportError:
+        return None
+    return Memory(os.path.join(get_cache_dir(), 'forecasts'), verbose=0)
+
+def trim_forecast_cache(memory) -> None:
+    """
+    Evict the least recently used memoized forecasts beyond FORECAST_CACHE_MAX_ITEMS.
+    
+    Args:
+        memory: joblib.Memory from get_forecast_memory
+    """
+    try:
+        memory.reduce_size(items_limit=FORECAST_CACHE_MAX_ITEMS)
+    except Exception:
+        # Eviction is housekeeping; a concurrent run may be trimming the same entries
+        pass
+
+def get_load_cache_path(args) -> Optional[str]:
+    """
+    Get the parquet cache path for the cleaned input of this run.
+    
+    The key covers the input file's path, mtime and size plus every option that
+    changes the cleaned frame, so editing the file invalidates the entry.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Cache file path, or None if caching does not apply (stdin input or caching disabled)
+    """
+    if not args.input or caching_disabled(args):
+        return None
+    try:
+        stat = os.stat(args.input)
+    except OSError:
+        return None
+    key = '|'.join(str(part) for part in (
+        LOAD_CACHE_VERSION, os.path.abspath(args.input), stat.st_mtime_ns, stat.st_size,
+        args.date_column, args.value_column, getattr(args, 'precision', DEFAULT_PRECISION),
+        getattr(args, 'group_column', None)
+    ))
+    return os.path.join(get_cache_dir(), f"{hashlib.sha1(key.encode()).hexdigest()}.parquet")
+
+def read_load_cache(cache_path: Optional[str]) -> Optional[pd.DataFrame]:
+    """
+    Read a cached cleaned frame, ignoring missing or unreadable entries.
+    
+    Args:
+        cache_path: Path from get_load_cache_path
+        
+    Returns:
+        Cached DataFrame, or None on a cache miss
+    """
+    if cache_path is None or not os.path.isfile(cache_path):
+        return None
+    try:
+        cached = pd.read_parquet(cache_path)
+    except Exception:
+        return None
+    try:
+        # Refresh the mtime so trim_load_cache evicts by last use, not by write
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return cached
+
+def write_load_cache(df: pd.DataFrame, cache_path: Optional[str]) -> None:
+    """
+    Store a cleaned frame in the cache. Failures (no parquet engine, read-only
+    cache directory) only mean the next run parses the CSV again.
+    
+    Args:
+        df: Cleaned DataFrame returned by load_data
+        cache_path: Path from get_load_cache_path
+    """
+    if cache_path is None:
+        return
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    trim_load_cache(os.path.dirname(cache_path))
+
+def trim_load_cache(cache_dir: str) -> None:
+    """
+    Evict the least recently used cached inputs beyond LOAD_CACHE_MAX_ITEMS.
+    
+    Every edit of an input file (or a new input path) adds an entry, so the
+    directory is bounded after each write. Entries are ranked by mtime, which
+    read_load_cache refreshes on every hit.
+    
+    Args:
+        cache_dir: Directory holding the parquet cache entries
+    """
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(entry.stat().st_mtime_ns, entry.path) for entry in it
+                       if entry.is_file() and entry.name.endswith('.parquet')]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[LOAD_CACHE_MAX_ITEMS:]:
+        try:
+            os.remove(path)
+        except OSError:
+            # A concurrent run may be trimming the same entries
+            pass
+
 def load_data(args) -> pd.DataFrame:
     """
     Load and validate input data from file or stdin.
     
+    Cleaned file input is cached as parquet (see get_load_cache_path), so
+    repeated runs over an unchanged file skip CSV parsing.
+    
     Args:
         args: Parsed command line arguments
         
@@ -344,25 +680,49 @@ def load_data(args) -> pd.DataFrame:
     Raises:
         SystemExit: If data validation fails
     """
-    # Read data from file or stdin
+    cache_path = get_load_cache_path(args)
+    cached = read_load_cache(cache_path)
+    if cached is not None:
+        return cached
+    
+    # Read data from file or stdin, parsing only the columns we forecast on
+    usecols = [args.date_column, args.value_column]
+    group_col = getattr(args, 'group_column', None)
+    if group_col:
+        usecols.append(group_col)
     if args.input:
-        df = read_input_from_file(args.input)
+        df = read_input_from_file(args.input, usecols)
     else:
-        df = read_input_from_stdin()
+        df = read_input_from_stdin(usecols)
     
     # Validate required columns
-    validate_required_columns(df, [args.date_column, args.value_column])
-    
-    # Clean and process data
-    df[args.date_column] = pd.to_datetime(df[args.date_column], errors='coerce')
-    df = df.sort_values(args.date_column)
-    df = df[[args.date_column, args.value_column]].dropna(subset=[args.date_column, args.value_column])
-    df[args.value_column] = pd.to_numeric(df[args.value_column], errors='coerce')
-    df = df.dropna(subset=[args.value_column])
+    validate_required_columns(df, usecols)
+    
+    # Clean and process data: coerce both columns, build one validity mask,
+    # and sort the surviving rows with a stable argsort (ties keep input order)
+    dates = parse_date_column(df[args.date_column])
+    values = df[args.value_column]
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors='coerce')
+    dtype = PRECISION_DTYPES[getattr(args, 'precision', DEFAULT_PRECISION)]
+    valid = (dates.notna() & values.notna()).to_numpy()
+    if group_col:
+        groups = df[group_col].array
+        valid &= df[group_col].notna().to_numpy()
+    dates = dates.array[valid]
+    order = np.argsort(dates, kind='stable')
+    df = pd.DataFrame({
+        args.date_column: dates[order],
+        args.value_column: np.asarray(values.array[valid][order], dtype=dtype)
+    })
+    if group_col:
+        # Rows keep their date order within each group
+        df.insert(0, group_col, groups[valid][order])
     
     if df.empty:
         handle_error("No valid data after filtering and cleaning.", 3)
     
+    write_load_cache(df, cache_path)
     return df
 
 def infer_granularity(df: pd.DataFrame, date_col: str) -> str:
@@ -376,16 +736,21 @@ def infer_granularity(df: pd.DataFrame, date_col: str) -> str:
     Returns:
         str: 'daily' or 'monthly'
     """
-    # If all dates are first of month, treat as monthly, else daily
-    days = df[date_col].dt.day.unique()
-    if set(days) == {1}:
+    dates = df[date_col]
+    # If all dates are first of month, treat as monthly, else daily. The first
+    # date is checked on its own before extracting the day of every row
+    if len(dates) and dates.iloc[0].day == 1 and np.all(dates.dt.day.to_numpy() == 1):
         return 'monthly'
-    freq = pd.infer_freq(df[date_col])
+    # Month-based frequencies need gaps of at least 28 days, so a shorter first
+    # gap rules them out without running pd.infer_freq over every row
+    if len(dates) >= 2 and dates.iloc[1] - dates.iloc[0] < pd.Timedelta(days=28):
+        return 'daily'
+    freq = pd.infer_freq(dates)
     if freq and freq.startswith('M'):
         return 'monthly'
     return 'daily'
 
-def get_forecast_dates(last_date: pd.Timestamp, granularity: str) -> List[pd.Timestamp]:
+def get_forecast_dates(last_date: pd.Timestamp, granularity: str) -> pd.DatetimeIndex:
     """
     Generate forecast dates based on granularity.
     
@@ -394,17 +759,13 @@ def get_forecast_dates(last_date: pd.Timestamp, granularity: str) -> List[pd.Tim
         granularity: 'daily' or 'monthly'
         
     Returns:
-        List of forecast dates
+        pd.DatetimeIndex: 12 month starts after last_date (monthly) or the next 365 days (daily)
     """
-    dates = []
+    last_date = pd.Timestamp(last_date)
     if granularity == 'monthly':
-        for i in range(1, 13):
-            next_month = (last_date + pd.DateOffset(months=i)).replace(day=1)
-            dates.append(next_month)
-    else:
-        for i in range(1, 366):
-            dates.append(last_date + timedelta(days=i))
-    return dates
+        return pd.date_range(last_date.replace(day=1) + pd.DateOffset(months=1), periods=12,
+                             freq=pd.DateOffset(months=1))
+    return pd.date_range(last_date + pd.Timedelta(days=1), periods=365, freq='D')
 
 def get_milestone_dates(last_date: pd.Timestamp, granularity: str) -> Dict[str, Any]:
     """
@@ -417,25 +778,92 @@ def get_milestone_dates(last_date: pd.Timestamp, granularity: str) -> Dict[str,
     Returns:
         Dict mapping milestone labels to dates
     """
-    from pandas.tseries.offsets import MonthEnd, QuarterEnd, YearEnd
-    milestones = {}
-    if granularity == 'monthly':
-        # End of this month, next month, next quarter, following quarter, year
-        milestones['end_of_this_month'] = (last_date + MonthEnd(1)).date()
-        milestones['end_of_next_month'] = (last_date + MonthEnd(2)).date()
-        milestones['end_of_next_quarter'] = (last_date + QuarterEnd(1)).date()
-        milestones['end_of_following_quarter'] = (last_date + QuarterEnd(2)).date()
-        milestones['end_of_year'] = (last_date + YearEnd(1)).date()
-    else:
-        # For daily, find the last day of each period after last_date
-        milestones['end_of_this_month'] = (last_date + MonthEnd(1)).date()
-        milestones['end_of_next_month'] = (last_date + MonthEnd(2)).date()
-        milestones['end_of_next_quarter'] = (last_date + QuarterEnd(1)).date()
-        milestones['end_of_following_quarter'] = (last_date + QuarterEnd(2)).date()
-        milestones['end_of_year'] = (last_date + YearEnd(1)).date()
-    return milestones
+    # Period ends strictly after last_date's day (the dates pandas' anchored
+    # MonthEnd/QuarterEnd/YearEnd offsets roll to), computed with integer
+    # month arithmetic; daily and monthly series share milestones
+    day = pd.Timestamp(last_date).date()
+    
+    def month_end(year: int, month: int) -> date:
+        year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+        return date(year, month, calendar.monthrange(year, month)[1])
+    
+    def next_end(first_month: int, step: int) -> date:
+        # Last day of the period starting at first_month, or of the next one if already reached
+        end = month_end(day.year, first_month + step - 1)
+        return end if end > day else month_end(day.year, first_month + 2 * step - 1)
+    
+    this_month_end = next_end(day.month, 1)
+    next_quarter_end = next_end(day.month - (day.month - 1) % 3, 3)
+    return {
+        'end_of_this_month': this_month_end,
+        'end_of_next_month': month_end(this_month_end.year, this_month_end.month + 1),
+        'end_of_next_quarter': next_quarter_end,
+        'end_of_following_quarter': month_end(next_quarter_end.year, next_quarter_end.month + 3),
+        'end_of_year': next_end(1, 12)
+    }
+
+def get_value_array(df: pd.DataFrame, value_col: str, dtype: Optional[type] = None) -> np.ndarray:
+    """
+    Extract the value column once as a C-contiguous float buffer for the forecast kernels.
+    
+    Nullable and pyarrow-backed columns are converted with NaN for missing
+    values, so kernels never see an object or read-only extension array.
+    load_data already stores the column as float64 (or float32), so for the
+    cleaned frame this is a view of the column's buffer, not a copy.
+    
+    Args:
+        df: Input DataFrame
+        value_col: Name of the value column
+        dtype: Target dtype; by default float32 columns (--precision fp32) stay
+            float32 and everything else becomes float64
+        
+    Returns:
+        np.ndarray: Contiguous 1-D array of values
+    """
+    column = df[value_col]
+    if dtype is None:
+        dtype = np.float32 if column.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(column.to_numpy(dtype=dtype, na_value=np.nan))
+
+def is_constant_series(values: np.ndarray) -> bool:
+    """
+    Check whether a series is flat, so model fits can be skipped.
+    
+    A flat line forecasts as itself; fitting ARIMA, Prophet or Holt-Winters to
+    it costs seconds, can fail to converge, and for an all-zero series makes
+    Holt-Winters divide by zero.
+    
+    Args:
+        values: 1-D array of observations
+        
+    Returns:
+        True if the series is non-empty and its range is negligible next to its level
+    """
+    if len(values) == 0:
+        return False
+    spread = float(values.max() - values.min())
+    return spread < CONSTANT_SERIES_RTOL * max(1.0, abs(float(values[0])))
+
+def moving_average_level(values: np.ndarray, window: int) -> float:
+    """
+    Mean of the last window observations, skipping NaN like rolling(min_periods=1).
+    
+    Only the final window is read, rather than computing every rolling mean.
+    
+    Args:
+        values: 1-D array of observations
+        window: SMA window size
+        
+    Returns:
+        Mean of the final window (NaN if it holds no observations)
+    """
+    tail = values[-window:]
+    tail = tail[~np.isnan(tail)]
+    if tail.size == 0:
+        return np.nan
+    return tail.mean(dtype=np.float64)
 
-def simple_moving_average_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], window: int) -> List[float]:
+def simple_moving_average_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], window: int) -> np.ndarray:
     """
     Generate Simple Moving Average forecast.
     
@@ -446,12 +874,68 @@ def simple_moving_average_forecast(df: pd.DataFrame, value_col: str, forecast_da
         window: SMA window size
         
     Returns:
-        List of forecasted values
+        Array of forecasted values (float64)
     """
-    last_sma = df[value_col].rolling(window=window, min_periods=1).mean().iloc[-1]
-    return [last_sma] * len(forecast_dates)
+    last_sma = moving_average_level(get_value_array(df, value_col), window)
+    return np.full(len(forecast_dates), last_sma, dtype=np.float64)
 
-def exponential_smoothing_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], alpha: float) -> List[float]:
+def get_numba_kernel(func):
+    """
+    Compile a pure-Python numeric kernel with numba on first use.
+    
+    numba is optional and slow to import, so it is only loaded when a caller
+    has enough data to benefit; the compiled kernel is cached to disk.
+    
+    Args:
+        func: Module-level function written in the numba-compatible subset
+        
+    Returns:
+        The compiled kernel, or None if numba is not installed
+    """
+    kernel = _numba_kernels.get(func.__name__)
+    if kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            kernel = False
+        else:
+            kernel = njit(cache=True)(func)
+        _numba_kernels[func.__name__] = kernel
+    return kernel or None
+
+def _es_recurrence(values, alpha):
+    es = values[0]
+    for i in range(1, values.shape[0]):
+        es = alpha * values[i] + (1.0 - alpha) * es
+    return es
+
+def exponential_smoothing_level(values: np.ndarray, alpha: float) -> float:
+    """
+    Final level of simple exponential smoothing, seeded with the first value.
+    
+    Unrolls es = alpha * v + (1 - alpha) * es into its closed form
+    (1 - alpha)^(n-1) * v[0] + alpha * sum((1 - alpha)^(n-1-i) * v[i], i >= 1),
+    evaluated as one dot product instead of a Python loop over every row.
+    Series longer than NUMBA_MIN_POINTS run the recurrence as a numba kernel
+    instead when numba is installed, avoiding the weight array.
+    
+    Args:
+        values: 1-D array of observations (at least one)
+        alpha: Smoothing parameter
+        
+    Returns:
+        Smoothed level after the last observation
+    """
+    if len(values) > NUMBA_MIN_POINTS:
+        kernel = get_numba_kernel(_es_recurrence)
+        if kernel is not None:
+            return kernel(values, alpha)
+    weights = np.power(1.0 - alpha, np.arange(len(values) - 1, -1, -1, dtype=values.dtype))
+    return weights[0] * values[0] + alpha * np.dot(weights[1:], values[1:])
+
+def exponential_smoothing_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], alpha: float,
+                                   model: str = DEFAULT_ES_MODEL, 
+                                   seasonal_periods: int = DEFAULT_HW_SEASONAL_PERIODS) -> np.ndarray:
     """
     Generate Exponential Smoothing forecast.
     
@@ -459,22 +943,78 @@ def exponential_smoothing_forecast(df: pd.DataFrame, value_col: str, forecast_da
         df: Input DataFrame
         value_col: Name of the value column
         forecast_dates: List of forecast dates
-        alpha: Smoothing parameter
+        alpha: Smoothing parameter (simple model only)
+        model: One of 'simple', 'holt' or 'holt-winters'
+        seasonal_periods: Season length for the holt-winters model
         
     Returns:
-        List of forecasted values
+        Array of forecasted values (float64; NaN if a statsmodels model is requested but unavailable)
     """
-    values = df[value_col].values
-    es = values[0]
-    for v in values[1:]:
-        es = alpha * v + (1 - alpha) * es
-    return [es] * len(forecast_dates)
+    if model != 'simple':
+        return np.asarray(statsmodels_exponential_smoothing_forecast(df, value_col, forecast_dates, model, seasonal_periods),
+                          dtype=np.float64)
+    
+    es = exponential_smoothing_level(get_value_array(df, value_col), alpha)
+    return np.full(len(forecast_dates), es, dtype=np.float64)
+
+def statsmodels_exponential_smoothing_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], 
+                                               model: str, seasonal_periods: int) -> List[float]:
+    """
+    Generate Holt or Holt-Winters forecast with fitted parameters using statsmodels.
+    
+    Args:
+        df: Input DataFrame
+        value_col: Name of the value column
+        forecast_dates: List of forecast dates
+        model: Either 'holt' (additive trend) or 'holt-winters' (additive trend and season)
+        seasonal_periods: Season length for the holt-winters model
+        
+    Returns:
+        List of forecasted values (or NaN if statsmodels not available)
+    """
+    if not os.environ.get("ENABLE_STATSMODELS"):
+        warnings.warn(f"[statsmodels-disabled] statsmodels usage disabled. ES ({model}) forecast will be NaN.")
+        return [np.nan] * len(forecast_dates)
+    try:
+        from statsmodels.tsa.holtwinters import ExponentialSmoothing
+    except ImportError:
+        warnings.warn(f"statsmodels is not installed. ES ({model}) forecast will be NaN.")
+        return [np.nan] * len(forecast_dates)
+    
+    values = get_value_array(df, value_col, np.float64)
+    seasonal = 'add' if model == 'holt-winters' else None
+    
+    try:
+        fitted_model = ExponentialSmoothing(
+            values,
+            trend='add',
+            seasonal=seasonal,
+            seasonal_periods=seasonal_periods if seasonal else None,
+            initialization_method='estimated'
+        ).fit(optimized=True, use_brute=False)
+        return fitted_model.forecast(steps=len(forecast_dates)).tolist()
+    except Exception as e:
+        warnings.warn(f"ES ({model}) forecast failed: {e}. Returning NaN.")
+        return [np.nan] * len(forecast_dates)
+
+def _hw_recurrence(values, level, trend, seasonal, alpha, beta, gamma, seasonal_periods):
+    for i in range(seasonal_periods, values.shape[0]):
+        # Update level
+        level[i] = alpha * (values[i] / seasonal[i - seasonal_periods]) + (1 - alpha) * (level[i-1] + trend[i-1])
+        
+        # Update trend
+        trend[i] = beta * (level[i] - level[i-1]) + (1 - beta) * trend[i-1]
+        
+        # Update seasonal
+        seasonal[i] = gamma * (values[i] / level[i]) + (1 - gamma) * seasonal[i - seasonal_periods]
 
 def holt_winters_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], 
                          alpha: float, beta: float, gamma: float, seasonal_periods: int) -> List[float]:
     """
     Generate Holt-Winters Triple Exponential Smoothing forecast.
     
+    A flat series (see is_constant_series) is forecast as its last value.
+    
     Args:
         df: Input DataFrame
         value_col: Name of the value column
@@ -487,15 +1027,16 @@ def holt_winters_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List
     Returns:
         List of forecasted values
     """
-    values = df[value_col].values
+    values = get_value_array(df, value_col, np.float64)
     n = len(values)
     
+    if is_constant_series(values):
+        return [float(values[-1])] * len(forecast_dates)
+    
     # Need at least 2 * seasonal_periods for proper initialization
     if n < 2 * seasonal_periods:
         # Fall back to simple exponential smoothing if insufficient data
-        es = values[0]
-        for v in values[1:]:
-            es = alpha * v + (1 - alpha) * es
+        es = exponential_smoothing_level(values, alpha)
         return [es] * len(forecast_dates)
     
     # Initialize level, trend, and seasonal components
@@ -503,25 +1044,22 @@ def holt_winters_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List
     trend = np.zeros(n)
     seasonal = np.zeros(n)
     
-    # Initial seasonal components (average of first seasonal_periods)
-    for i in range(seasonal_periods):
-        seasonal[i] = values[i] / np.mean(values[:seasonal_periods])
+    # Means of the first two seasons
+    first_mean = np.mean(values[:seasonal_periods])
+    second_mean = np.mean(values[seasonal_periods:2*seasonal_periods])
+    
+    # Initial seasonal components (ratio to the first season's average)
+    seasonal[:seasonal_periods] = values[:seasonal_periods] / first_mean
     
     # Initial level and trend
-    level[seasonal_periods - 1] = np.mean(values[:seasonal_periods])
-    trend[seasonal_periods - 1] = (np.mean(values[seasonal_periods:2*seasonal_periods]) - 
-                                   np.mean(values[:seasonal_periods])) / seasonal_periods
+    level[seasonal_periods - 1] = first_mean
+    trend[seasonal_periods - 1] = (second_mean - first_mean) / seasonal_periods
     
-    # Holt-Winters triple exponential smoothing
-    for i in range(seasonal_periods, n):
-        # Update level
-        level[i] = alpha * (values[i] / seasonal[i - seasonal_periods]) + (1 - alpha) * (level[i-1] + trend[i-1])
-        
-        # Update trend
-        trend[i] = beta * (level[i] - level[i-1]) + (1 - beta) * trend[i-1]
-        
-        # Update seasonal
-        seasonal[i] = gamma * (values[i] / level[i]) + (1 - gamma) * seasonal[i - seasonal_periods]
+    # Holt-Winters triple exponential smoothing, as a numba kernel on long series
+    recurrence = _hw_recurrence
+    if n > NUMBA_MIN_POINTS:
+        recurrence = get_numba_kernel(_hw_recurrence) or _hw_recurrence
+    recurrence(values, level, trend, seasonal, alpha, beta, gamma, seasonal_periods)
     
     # Generate forecasts
     forecasts = []
@@ -537,15 +1075,20 @@ def holt_winters_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List
     
     return forecasts
 
-def arima_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], order: Tuple[int, int, int]) -> List[float]:
+def arima_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], order: Tuple[int, int, int],
+                   memory=None) -> List[float]:
     """
     Generate ARIMA forecast.
     
+    A flat series (see is_constant_series) is forecast as its last value
+    without fitting.
+    
     Args:
         df: Input DataFrame
         value_col: Name of the value column
         forecast_dates: List of forecast dates
         order: ARIMA order (p, d, q)
+        memory: Optional joblib.Memory (see get_forecast_memory) memoizing the fit
         
     Returns:
         List of forecasted values (or NaN if statsmodels not available)
@@ -555,33 +1098,64 @@ def arima_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Tim
         warnings.warn("[statsmodels-disabled] statsmodels usage disabled. ARIMA forecast will be NaN.")
         return [np.nan] * len(forecast_dates)
     try:
-        from statsmodels.tsa.arima.model import ARIMA
+        from statsmodels.tsa.arima.model import ARIMA  # noqa: F401
     except ImportError:
         warnings.warn("statsmodels is not installed. ARIMA forecast will be NaN.")
         return [np.nan] * len(forecast_dates)
     
-    values = df[value_col].values
+    values = get_value_array(df, value_col, np.float64)
+    if is_constant_series(values):
+        return [float(values[-1])] * len(forecast_dates)
+    fit_forecast = memory.cache(fit_forecast_arima) if memory is not None else fit_forecast_arima
     
     try:
-        model = ARIMA(values, order=order)
-        fitted_model = model.fit()
-        forecast = fitted_model.forecast(steps=len(forecast_dates))
-        return forecast.tolist()
+        forecast = fit_forecast(values, order, len(forecast_dates))
     except Exception as e:
         warnings.warn(f"ARIMA forecast failed: {e}. Returning NaN.")
         return [np.nan] * len(forecast_dates)
+    if memory is not None:
+        trim_forecast_cache(memory)
+    return forecast.tolist()
+
+def fit_forecast_arima(values: np.ndarray, order: Tuple[int, int, int], steps: int,
+                       cache_version: int = FORECAST_CACHE_VERSION) -> np.ndarray:
+    """
+    Fit ARIMA and forecast the next steps values.
+    
+    The result depends only on the arguments, so arima_forecast can memoize
+    this function with joblib, keyed on the data, order and horizon.
+    
+    Args:
+        values: History values (float64)
+        order: ARIMA order (p, d, q)
+        steps: Number of values to forecast
+        cache_version: FORECAST_CACHE_VERSION; part of the memoization key only
+        
+    Returns:
+        Array of forecasted values
+    """
+    from statsmodels.tsa.arima.model import ARIMA
+    # Only point forecasts are used: skip the parameter covariance and keep
+    # just the filter output forecasting needs
+    fitted_model = ARIMA(values, order=order).fit(low_memory=True, cov_type='none')
+    return np.asarray(fitted_model.forecast(steps=steps), dtype=np.float64)
 
 def sarima_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], 
-                   order: Tuple[int, int, int], seasonal_order: Tuple[int, int, int, int]) -> List[float]:
+                   order: Tuple[int, int, int], seasonal_order: Tuple[int, int, int, int],
+                   memory=None) -> List[float]:
     """
     Generate SARIMA forecast.
     
+    A flat series (see is_constant_series) is forecast as its last value
+    without fitting.
+    
     Args:
         df: Input DataFrame
         value_col: Name of the value column
         forecast_dates: List of forecast dates
         order: SARIMA order (p, d, q)
         seasonal_order: SARIMA seasonal order (P, D, Q, s)
+        memory: Optional joblib.Memory (see get_forecast_memory) memoizing the fit
         
     Returns:
         List of forecasted values (or NaN if statsmodels not available)
@@ -591,21 +1165,50 @@ def sarima_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Ti
         warnings.warn("[statsmodels-disabled] statsmodels usage disabled. SARIMA forecast will be NaN.")
         return [np.nan] * len(forecast_dates)
     try:
-        from statsmodels.tsa.statespace.sarimax import SARIMAX
+        from statsmodels.tsa.statespace.sarimax import SARIMAX  # noqa: F401
     except ImportError:
         warnings.warn("statsmodels is not installed. SARIMA forecast will be NaN.")
         return [np.nan] * len(forecast_dates)
     
-    values = df[value_col].values
+    values = get_value_array(df, value_col, np.float64)
+    if is_constant_series(values):
+        return [float(values[-1])] * len(forecast_dates)
+    fit_forecast = memory.cache(fit_forecast_sarima) if memory is not None else fit_forecast_sarima
     
     try:
-        model = SARIMAX(values, order=order, seasonal_order=seasonal_order)
-        fitted_model = model.fit(disp=False)
-        forecast = fitted_model.forecast(steps=len(forecast_dates))
-        return forecast.tolist()
+        forecast = fit_forecast(values, order, seasonal_order, len(forecast_dates))
     except Exception as e:
         warnings.warn(f"SARIMA forecast failed: {e}. Returning NaN.")
         return [np.nan] * len(forecast_dates)
+    if memory is not None:
+        trim_forecast_cache(memory)
+    return forecast.tolist()
+
+def fit_forecast_sarima(values: np.ndarray, order: Tuple[int, int, int], seasonal_order: Tuple[int, int, int, int],
+                        steps: int, cache_version: int = FORECAST_CACHE_VERSION) -> np.ndarray:
+    """
+    Fit SARIMA and forecast the next steps values.
+    
+    The result depends only on the arguments, so sarima_forecast can memoize
+    this function with joblib, keyed on the data, orders and horizon.
+    
+    Args:
+        values: History values (float64)
+        order: SARIMA order (p, d, q)
+        seasonal_order: SARIMA seasonal order (P, D, Q, s)
+        steps: Number of values to forecast
+        cache_version: FORECAST_CACHE_VERSION; part of the memoization key only
+        
+    Returns:
+        Array of forecasted values
+    """
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+    # Only point forecasts are used: skip the parameter covariance and keep
+    # just the filter output forecasting needs
+    fitted_model = SARIMAX(values, order=order, seasonal_order=seasonal_order).fit(
+        disp=False, low_memory=True, cov_type='none'
+    )
+    return np.asarray(fitted_model.forecast(steps=steps), dtype=np.float64)
 
 def theta_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], theta: float) -> List[float]:
     """
@@ -625,38 +1228,33 @@ def theta_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Tim
     Returns:
         List of forecasted values
     """
-    values = df[value_col].values
+    values = get_value_array(df, value_col, np.float64)
     n = len(values)
     
     if n < 2:
         return [values[-1]] * len(forecast_dates)
     
-    # Calculate linear trend
-    x = np.arange(n)
-    coeffs = np.polyfit(x, values, 1)
-    trend = coeffs[0] * x + coeffs[1]
+    # Calculate linear trend: least squares in closed form. x is 0..n-1, so its
+    # mean and sum of squares are known and the values take one dot product
+    x_mean = (n - 1) / 2.0
+    slope = np.dot(np.arange(n) - x_mean, values) / (n * (n * n - 1) / 12.0)
+    intercept = values.mean() - slope * x_mean
     
-    # Calculate detrended series
-    detrended = values - trend
+    # Only the last two points of the trend and theta line are needed
+    trend = slope * np.arange(n - 2, n) + intercept
     
     # Create theta line: apply theta transformation to detrended series
     # The theta line should maintain the same level as the original series
-    theta_line = theta * detrended + trend
+    theta_line = theta * (values[-2:] - trend) + trend
     
-    # Forecast using linear extrapolation
-    forecasts = []
-    for h in range(1, len(forecast_dates) + 1):
-        # Linear trend forecast
-        trend_forecast = coeffs[0] * (n + h - 1) + coeffs[1]
-        
-        # Theta line forecast (extrapolate the theta line)
-        theta_forecast = theta_line[-1] + (theta_line[-1] - theta_line[-2]) if len(theta_line) > 1 else theta_line[-1]
-        
-        # Combine trend and theta components
-        forecast = trend_forecast + (theta_forecast - trend[-1])
-        forecasts.append(forecast)
+    # Theta line forecast (extrapolate the theta line one step); the same for every horizon
+    theta_forecast = theta_line[-1] + (theta_line[-1] - theta_line[-2])
+    theta_offset = theta_forecast - trend[-1]
     
-    return forecasts
+    # Linear trend forecast for all horizons at once, combined with the theta component
+    h = np.arange(1, len(forecast_dates) + 1)
+    trend_forecast = slope * (n + h - 1) + intercept
+    return (trend_forecast + theta_offset).tolist()
 
 def parse_order_parameter(order_str: str, expected_length: int) -> Tuple[int, ...]:
     """
@@ -672,6 +1270,9 @@ def parse_order_parameter(order_str: str, expected_length: int) -> Tuple[int, ..
     Raises:
         SystemExit: If parsing fails
     """
+    default_order = DEFAULT_ORDER_STRINGS.get(order_str)
+    if default_order is not None and len(default_order) == expected_length:
+        return default_order
     try:
         parts = [int(x.strip()) for x in order_str.split(',')]
         if len(parts) != expected_length:
@@ -680,10 +1281,43 @@ def parse_order_parameter(order_str: str, expected_length: int) -> Tuple[int, ..
     except ValueError:
         handle_error(f"Invalid order parameter format: {order_str}", 1)
 
-def prophet_forecast(df: pd.DataFrame, date_col: str, value_col: str, forecast_dates: List[pd.Timestamp], args) -> List[float]:
+def resolve_prophet_seasonality(df: pd.DataFrame, date_col: str, daily: bool, weekly: bool, yearly: bool) -> Tuple[bool, bool, bool]:
+    """
+    Turn off requested Prophet seasonalities the data cannot support.
+    
+    Each seasonality adds Fourier columns to Prophet's fit, so components that
+    are unidentifiable are dropped: daily and weekly terms on monthly data or
+    on fewer than two weeks of points, and yearly terms on less than two years.
+    
+    Args:
+        df: Input DataFrame
+        date_col: Name of the date column
+        daily: Requested daily seasonality
+        weekly: Requested weekly seasonality
+        yearly: Requested yearly seasonality
+        
+    Returns:
+        Tuple of (daily, weekly, yearly) flags to pass to Prophet
+    """
+    n = len(df)
+    sub_monthly = n >= 14 and infer_granularity(df, date_col) != 'monthly'
+    span = df[date_col].max() - df[date_col].min() if n else pd.Timedelta(0)
+    return (
+        daily and sub_monthly,
+        weekly and sub_monthly,
+        yearly and span >= pd.Timedelta(days=730)
+    )
+
+def prophet_forecast(df: pd.DataFrame, date_col: str, value_col: str, forecast_dates: List[pd.Timestamp], args) -> np.ndarray:
     """
     Generate Prophet forecast.
     
+    Only yhat is reported, so uncertainty sampling (the dominant cost of
+    predict) is disabled unless --prophet-uncertainty-samples is set. Results
+    are memoized on disk (see get_forecast_memory), so repeated runs on the
+    same data and parameters skip the Stan fit. A flat series (see
+    is_constant_series) is forecast as its last value without fitting.
+    
     Args:
         df: Input DataFrame
         date_col: Name of the date column
@@ -692,31 +1326,72 @@ def prophet_forecast(df: pd.DataFrame, date_col: str, value_col: str, forecast_d
         args: Command line arguments
         
     Returns:
-        List of forecasted values (or NaN if Prophet not available)
+        Array of forecasted values (float64; NaN if Prophet not available)
     """
     try:
-        from prophet import Prophet
+        import prophet  # noqa: F401
     except ImportError:
-        try:
-            from fbprophet import Prophet
-        except ImportError:
-            warnings.warn("[prophet-missing] Prophet is not installed. Install with: pip install prophet. Column 'prophet' will be NaN.")
-            return [np.nan] * len(forecast_dates)
+        warnings.warn("[prophet-missing] Prophet is not installed. Install with: pip install prophet. Column 'prophet' will be NaN.")
+        return np.full(len(forecast_dates), np.nan)
+    
+    # Prophet fits in float64 internally, so fp32 inputs are promoted once here
+    values = get_value_array(df, value_col, np.float64)
+    if is_constant_series(values):
+        return np.full(len(forecast_dates), values[-1])
     
-    prophet_df = df.rename(columns={date_col: 'ds', value_col: 'y'})
-    model = Prophet(
-        daily_seasonality=args.prophet_daily_seasonality,
-        yearly_seasonality=args.prophet_yearly_seasonality,
-        weekly_seasonality=args.prophet_weekly_seasonality,
-        changepoint_prior_scale=args.prophet_changepoint_prior_scale,
-        seasonality_prior_scale=args.prophet_seasonality_prior_scale
+    daily, weekly, yearly = resolve_prophet_seasonality(
+        df, date_col, args.prophet_daily_seasonality, args.prophet_weekly_seasonality, args.prophet_yearly_seasonality
     )
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        model.fit(prophet_df)
-    future = pd.DataFrame({'ds': forecast_dates})
-    forecast = model.predict(future)
-    return forecast['yhat'].values
+    params = {
+        'daily_seasonality': daily,
+        'yearly_seasonality': yearly,
+        'weekly_seasonality': weekly,
+        'changepoint_prior_scale': args.prophet_changepoint_prior_scale,
+        'seasonality_prior_scale': args.prophet_seasonality_prior_scale,
+        'n_changepoints': getattr(args, 'prophet_n_changepoints', DEFAULT_PROPHET_N_CHANGEPOINTS),
+        'mcmc_samples': 0,
+        'uncertainty_samples': getattr(args, 'prophet_uncertainty_samples', DEFAULT_PROPHET_UNCERTAINTY_SAMPLES)
+    }
+    fit_predict = fit_predict_prophet
+    memory = None if getattr(args, 'no_prophet_cache', False) else get_forecast_memory(args)
+    if memory is not None:
+        fit_predict = memory.cache(fit_predict_prophet)
+    yhat = fit_predict(
+        df[date_col].to_numpy(dtype='datetime64[ns]'),
+        values,
+        pd.DatetimeIndex(forecast_dates).to_numpy(),
+        params
+    )
+    if memory is not None:
+        trim_forecast_cache(memory)
+    return yhat
+
+def fit_predict_prophet(ds: np.ndarray, y: np.ndarray, future_ds: np.ndarray, params: Dict[str, Any],
+                        cache_version: int = FORECAST_CACHE_VERSION) -> np.ndarray:
+    """
+    Fit Prophet and predict yhat for the requested dates.
+    
+    The result depends only on the arguments, so prophet_forecast memoizes this
+    function with joblib, keyed on the data, dates and model parameters.
+    
+    Args:
+        ds: History dates (datetime64[ns])
+        y: History values (float64)
+        future_ds: Dates to forecast (datetime64[ns])
+        params: Keyword arguments for the Prophet constructor
+        cache_version: FORECAST_CACHE_VERSION; part of the memoization key only
+        
+    Returns:
+        Array of yhat values aligned to future_ds
+    """
+    from prophet import Prophet
+    model = Prophet(**params)
+    model.fit(pd.DataFrame({'ds': ds, 'y': y}))
+    forecast = model.predict(pd.DataFrame({'ds': future_ds}))
+    # Align yhat to future_ds by ds in one indexed gather rather than
+    # relying on predict's row order
+    yhat_by_ds = forecast.set_index('ds')['yhat']
+    return yhat_by_ds.reindex(pd.DatetimeIndex(future_ds)).to_numpy(dtype=np.float64)
 
 def neural_prophet_forecast(df: pd.DataFrame, date_col: str, value_col: str, forecast_dates: List[pd.Timestamp], args) -> List[float]:
     """
@@ -733,7 +1408,7 @@ def neural_prophet_forecast(df: pd.DataFrame, date_col: str, value_col: str, for
         List of forecasted values (or NaN if NeuralProphet not available)
     """
     # Handle constant/near-constant series by short-circuiting to a stable forecast
-    values = df[value_col].to_numpy()
+    values = get_value_array(df, value_col, np.float64)
     if len(values) == 0 or len(forecast_dates) == 0:
         return [np.nan] * len(forecast_dates)
     if np.allclose(values, values[0]):
@@ -746,23 +1421,58 @@ def neural_prophet_forecast(df: pd.DataFrame, date_col: str, value_col: str, for
         warnings.warn("[neuralprophet-missing] NeuralProphet not installed. Install with: pip install neuralprophet (requires torch). Column 'neural_prophet' will be NaN.")
         return [np.nan] * len(forecast_dates)
     
-    prophet_df = df.rename(columns={date_col: 'ds', value_col: 'y'})
+    params = {
+        'daily_seasonality': getattr(args, 'prophet_daily_seasonality', True),
+        'yearly_seasonality': getattr(args, 'prophet_yearly_seasonality', True),
+        'weekly_seasonality': getattr(args, 'prophet_weekly_seasonality', False),
+        'changepoints_range': getattr(args, 'prophet_changepoint_prior_scale', 0.05),
+        'seasonality_reg': getattr(args, 'prophet_seasonality_prior_scale', 10.0)
+    }
+    fit_predict = fit_predict_neural_prophet
+    memory = get_forecast_memory(args)
+    if memory is not None:
+        fit_predict = memory.cache(fit_predict_neural_prophet)
     
     try:
-        model = NeuralProphet(
-            daily_seasonality=getattr(args, 'prophet_daily_seasonality', True),
-            yearly_seasonality=getattr(args, 'prophet_yearly_seasonality', True),
-            weekly_seasonality=getattr(args, 'prophet_weekly_seasonality', False),
-            changepoints_range=getattr(args, 'prophet_changepoint_prior_scale', 0.05),
-            seasonality_reg=getattr(args, 'prophet_seasonality_prior_scale', 10.0)
+        # The torch model trains in float32, so hand it float32 values rather
+        # than having every batch downcast from float64
+        yhat = fit_predict(
+            df[date_col].to_numpy(dtype='datetime64[ns]'),
+            values.astype(np.float32),
+            pd.DatetimeIndex(forecast_dates).to_numpy(),
+            params
         )
-        model.fit(prophet_df, freq='D')
-        future = pd.DataFrame({'ds': forecast_dates})
-        forecast = model.predict(future)
-        return forecast['yhat'].values
     except Exception as e:
         warnings.warn(f"[neuralprophet-failed] NeuralProphet run failed: {e}. Column 'neural_prophet' will be NaN.")
         return [np.nan] * len(forecast_dates)
+    if memory is not None:
+        trim_forecast_cache(memory)
+    return yhat
+
+def fit_predict_neural_prophet(ds: np.ndarray, y: np.ndarray, future_ds: np.ndarray, params: Dict[str, Any],
+                               cache_version: int = FORECAST_CACHE_VERSION) -> np.ndarray:
+    """
+    Fit NeuralProphet and predict yhat for the requested dates.
+    
+    The result depends only on the arguments, so neural_prophet_forecast
+    memoizes this function with joblib, keyed on the data, dates and model
+    parameters.
+    
+    Args:
+        ds: History dates (datetime64[ns])
+        y: History values (float32)
+        future_ds: Dates to forecast (datetime64[ns])
+        params: Keyword arguments for the NeuralProphet constructor
+        cache_version: FORECAST_CACHE_VERSION; part of the memoization key only
+        
+    Returns:
+        Array of yhat values
+    """
+    from neuralprophet import NeuralProphet
+    model = NeuralProphet(**params)
+    model.fit(pd.DataFrame({'ds': ds, 'y': y}), freq='D')
+    forecast = model.predict(pd.DataFrame({'ds': future_ds}))
+    return forecast['yhat'].to_numpy()
 
 def ensemble_forecast(forecasts: Dict[str, List[float]]) -> List[float]:
     """
@@ -777,25 +1487,21 @@ def ensemble_forecast(forecasts: Dict[str, List[float]]) -> List[float]:
     if not forecasts:
         return []
     
-    # Get the length from the first forecast
+    # Get the length from the first forecast; stack all forecasts into one
+    # (algorithms x steps) block, NaN-padding any that are shorter
     forecast_length = len(next(iter(forecasts.values())))
-    ensemble_values = []
-    
-    for i in range(forecast_length):
-        values = []
-        for algo, forecast in forecasts.items():
-            if i < len(forecast) and not np.isnan(forecast[i]):
-                values.append(forecast[i])
-        
-        if values:
-            ensemble_values.append(np.mean(values))
-        else:
-            ensemble_values.append(np.nan)
+    stacked = np.full((len(forecasts), forecast_length), np.nan)
+    for row, forecast in zip(stacked, forecasts.values()):
+        forecast = np.asarray(forecast, dtype=np.float64)[:forecast_length]
+        row[:len(forecast)] = forecast
     
-    return ensemble_values
+    # Steps where every algorithm is NaN stay NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(stacked, axis=0).tolist()
 
 def darts_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Timestamp], 
-                  algorithm: str = 'exponential_smoothing') -> List[float]:
+                  algorithm: str = 'exponential_smoothing', memory=None) -> List[float]:
     """
     Generate forecast using Darts library algorithms.
     
@@ -804,6 +1510,7 @@ def darts_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Tim
         value_col: Name of the value column
         forecast_dates: List of forecast dates
         algorithm: Darts algorithm to use
+        memory: Optional joblib.Memory (see get_forecast_memory) memoizing the fit
         
     Returns:
         List of forecasted values (or NaN if Darts not available)
@@ -815,8 +1522,8 @@ def darts_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Tim
         warnings.warn("[darts-disabled] darts usage disabled. Darts forecast will be NaN.")
         return [np.nan] * len(forecast_dates)
     try:
-        from darts import TimeSeries
-        from darts.models import (
+        from darts import TimeSeries  # noqa: F401
+        from darts.models import (  # noqa: F401
             ExponentialSmoothing, ARIMA, AutoARIMA, Theta, 
             LinearRegressionModel, RandomForest, XGBModel
         )
@@ -824,88 +1531,196 @@ def darts_forecast(df: pd.DataFrame, value_col: str, forecast_dates: List[pd.Tim
         warnings.warn("[darts-missing] Darts not installed. Install with: pip install u8darts. Column 'darts' will be NaN.")
         return [np.nan] * len(forecast_dates)
     
-    values = df[value_col].values
+    if algorithm not in DARTS_ALGORITHMS:
+        warnings.warn(f"Unknown Darts algorithm: {algorithm}. Using ExponentialSmoothing.")
+        algorithm = 'exponential_smoothing'
+    values = get_value_array(df, value_col, np.float64)
+    fit_forecast = memory.cache(fit_forecast_darts) if memory is not None else fit_forecast_darts
     
     try:
-        # Create TimeSeries object
-        ts = TimeSeries.from_values(values)
-        
-        # Select algorithm
-        if algorithm == 'exponential_smoothing':
-            model = ExponentialSmoothing()
-        elif algorithm == 'arima':
-            model = ARIMA(p=1, d=1, q=1)
-        elif algorithm == 'auto_arima':
-            model = AutoARIMA()
-        elif algorithm == 'theta':
-            model = Theta()
-        elif algorithm == 'linear_regression':
-            model = LinearRegressionModel(lags=12)
-        elif algorithm == 'random_forest':
-            model = RandomForest(lags=12)
-        elif algorithm == 'xgboost':
-            model = XGBModel(lags=12)
-        else:
-            warnings.warn(f"Unknown Darts algorithm: {algorithm}. Using ExponentialSmoothing.")
-            model = ExponentialSmoothing()
-        
-        # Fit and forecast
-        model.fit(ts)
-        forecast = model.predict(len(forecast_dates))
-        return forecast.values().flatten().tolist()
-        
+        forecast = fit_forecast(values, algorithm, len(forecast_dates))
     except Exception as e:
         warnings.warn(f"[darts-failed] Darts {algorithm} failed: {e}. Column 'darts' will be NaN.")
         return [np.nan] * len(forecast_dates)
+    if memory is not None:
+        trim_forecast_cache(memory)
+    return forecast.tolist()
 
-def main() -> None:
-    """Main entry point for the CLI tool."""
-    parser = create_argument_parser()
-    args = parser.parse_args()
+def fit_forecast_darts(values: np.ndarray, algorithm: str, steps: int,
+                       cache_version: int = FORECAST_CACHE_VERSION) -> np.ndarray:
+    """
+    Fit a Darts model and forecast the next steps values.
     
-    # Load and validate data
-    df = load_data(args)
-    if len(df) < MIN_DATA_POINTS:
-        handle_error(f"Not enough data to forecast. At least {MIN_DATA_POINTS} dates are required.", 3)
+    The result depends only on the arguments, so darts_forecast can memoize
+    this function with joblib, keyed on the data, algorithm and horizon.
+    
+    Args:
+        values: History values (float64)
+        algorithm: One of DARTS_ALGORITHMS
+        steps: Number of values to forecast
+        cache_version: FORECAST_CACHE_VERSION; part of the memoization key only
+        
+    Returns:
+        Array of forecasted values
+    """
+    from darts import TimeSeries
+    from darts.models import (
+        ExponentialSmoothing, ARIMA, AutoARIMA, Theta, 
+        LinearRegressionModel, RandomForest, XGBModel
+    )
     
+    # Create TimeSeries object
+    ts = TimeSeries.from_values(values)
+    
+    # Select algorithm
+    if algorithm == 'arima':
+        model = ARIMA(p=1, d=1, q=1)
+    elif algorithm == 'auto_arima':
+        model = AutoARIMA()
+    elif algorithm == 'theta':
+        model = Theta()
+    elif algorithm == 'linear_regression':
+        model = LinearRegressionModel(lags=12)
+    elif algorithm == 'random_forest':
+        model = RandomForest(lags=12)
+    elif algorithm == 'xgboost':
+        model = XGBModel(lags=12)
+    else:
+        model = ExponentialSmoothing()
+    
+    # Fit and forecast
+    model.fit(ts)
+    forecast = model.predict(steps)
+    return np.asarray(forecast.values(), dtype=np.float64).flatten()
+
+def summarize_milestones(forecast_only: pd.DataFrame, date_col: str, milestones: Dict[str, Any],
+                         algorithms: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Sum each algorithm's forecast up to and including every milestone date.
+    
+    Args:
+        forecast_only: Output rows holding forecasted dates only
+        date_col: Name of the date column
+        milestones: Dict mapping milestone labels to dates
+        algorithms: Forecast columns to total
+        
+    Returns:
+        Dict mapping milestone labels to {'date': date, 'totals': {algo: total}}
+    """
+    dates = pd.to_datetime(forecast_only[date_col]).to_numpy()
+    # One contiguous row per algorithm, in date order, so each milestone total
+    # is a NaN-skipping sum over a prefix of the row
+    block = np.ascontiguousarray(forecast_only[algorithms].to_numpy(dtype=np.float64, na_value=np.nan).T)
+    if not forecast_only[date_col].is_monotonic_increasing:
+        order = np.argsort(dates, kind='stable')
+        dates = dates[order]
+        block = block[:, order]
+    ends = np.array([pd.Timestamp(mdate).to_datetime64() for mdate in milestones.values()], dtype=dates.dtype)
+    positions = np.searchsorted(dates, ends, side='right')
+    
+    summary = {}
+    for (label, mdate), end in zip(milestones.items(), positions):
+        totals = np.nansum(block[:, :end], axis=1)
+        summary[label] = {
+            'date': mdate,
+            'totals': {algo: float(total) for algo, total in zip(algorithms, totals)}
+        }
+    return summary
+
+def write_json_forecast(out_df: pd.DataFrame, summary: Optional[Dict[Any, Any]], grouped: bool = False) -> None:
+    """
+    Write the forecast table (and milestone summary, if any) as one JSON document to stdout.
+    
+    Args:
+        out_df: Output DataFrame with actuals and forecast columns
+        summary: Milestone summary from summarize_milestones, or None
+        grouped: Whether summary maps each --group-column value to its own summary
+    """
+    def milestones_json(milestones):
+        return {
+            label: {'date': str(entry['date']), **entry['totals']}
+            for label, entry in milestones.items()
+        }
+    
+    document = {
+        'forecast': json.loads(out_df.to_json(orient='records', date_format='iso', date_unit='s'))
+    }
+    if summary is not None:
+        if grouped:
+            document['milestone_summary'] = {str(name): milestones_json(entry) for name, entry in summary.items()}
+        else:
+            document['milestone_summary'] = milestones_json(summary)
+    json.dump(document, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+def forecast_series(df: pd.DataFrame, args) -> Tuple[pd.DataFrame, Optional[Dict[str, Dict[str, Any]]]]:
+    """
+    Run every configured forecaster on one cleaned, date-sorted series.
+    
+    Args:
+        df: Cleaned DataFrame from load_data (one series)
+        args: Parsed command line arguments
+        
+    Returns:
+        Tuple of the output table (input rows followed by forecast rows) and the
+        milestone summary, which is None unless --milestone-summary is set
+    """
     date_col = args.date_column
     value_col = args.value_column
     granularity = infer_granularity(df, date_col)
     last_date = df[date_col].max()
     forecast_dates = get_forecast_dates(last_date, granularity)
 
-    # Prepare output DataFrame: all input + forecasted dates
-    all_dates = list(df[date_col]) + forecast_dates
-    all_dates = pd.Series(all_dates).drop_duplicates().sort_values()
-    out_df = pd.DataFrame({date_col: all_dates})
-    out_df = out_df.merge(df, on=date_col, how='left')
-
     # Parse order parameters
     arima_order = parse_order_parameter(args.arima_order, 3)
     sarima_order = parse_order_parameter(args.sarima_order, 3)
     sarima_seasonal_order = parse_order_parameter(args.sarima_seasonal_order, 4)
 
-    # Compute forecasts for forecasted dates only
-    sma_forecast = simple_moving_average_forecast(df, value_col, forecast_dates, args.sma_window)
-    es_forecast = exponential_smoothing_forecast(df, value_col, forecast_dates, args.es_alpha)
-    hw_forecast = holt_winters_forecast(df, value_col, forecast_dates, 
-                                       args.hw_alpha, args.hw_beta, args.hw_gamma, args.hw_seasonal_periods)
-    arima_forecast_vals = arima_forecast(df, value_col, forecast_dates, arima_order)
-    sarima_forecast_vals = sarima_forecast(df, value_col, forecast_dates, sarima_order, sarima_seasonal_order)
-    theta_forecast_vals = theta_forecast(df, value_col, forecast_dates, args.theta_method)
-    prophet_forecast_vals = prophet_forecast(df, date_col, value_col, forecast_dates, args)
-    
-    # NeuralProphet is optional
+    # Compute forecasts for forecasted dates only. The model-fitting forecasters
+    # spend their time outside the interpreter (Prophet's Stan fit in a cmdstan
+    # subprocess, statsmodels and torch in native code), so start them first in
+    # worker threads and overlap them with the closed-form forecasters. ARIMA,
+    # SARIMA and Darts fits are memoized on disk like Prophet's
+    memory = get_forecast_memory(args)
+    model_tasks = {
+        'prophet': (prophet_forecast, (df, date_col, value_col, forecast_dates, args)),
+        'arima': (arima_forecast, (df, value_col, forecast_dates, arima_order, memory)),
+        'sarima': (sarima_forecast, (df, value_col, forecast_dates, sarima_order,
+                                     sarima_seasonal_order, memory)),
+    }
+    # NeuralProphet and Darts are optional
     if getattr(args, 'neural_prophet', False):
-        neural_prophet_forecast_vals = neural_prophet_forecast(df, date_col, value_col, forecast_dates, args)
-    else:
-        neural_prophet_forecast_vals = [np.nan] * len(forecast_dates)
-    
-    # Darts forecast
+        model_tasks['neural_prophet'] = (neural_prophet_forecast, (df, date_col, value_col, forecast_dates, args))
     if getattr(args, 'darts_algorithm', None):
-        darts_forecast_vals = darts_forecast(df, value_col, forecast_dates, args.darts_algorithm)
-    else:
-        darts_forecast_vals = [np.nan] * len(forecast_dates)
+        model_tasks['darts'] = (darts_forecast, (df, value_col, forecast_dates, args.darts_algorithm, memory))
+    
+    # --jobs 1 fits everything serially in this thread
+    jobs = min(getattr(args, 'jobs', None) or MAX_FORECAST_THREADS, len(model_tasks))
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext()
+    with pool as executor:
+        futures = {}
+        if executor is not None:
+            futures = {name: executor.submit(func, *func_args) for name, (func, func_args) in model_tasks.items()}
+        
+        sma_forecast = simple_moving_average_forecast(df, value_col, forecast_dates, args.sma_window)
+        es_forecast = exponential_smoothing_forecast(df, value_col, forecast_dates, args.es_alpha,
+                                                     args.es_model, args.hw_seasonal_periods)
+        hw_forecast = holt_winters_forecast(df, value_col, forecast_dates, 
+                                           args.hw_alpha, args.hw_beta, args.hw_gamma, args.hw_seasonal_periods)
+        theta_forecast_vals = theta_forecast(df, value_col, forecast_dates, args.theta_method)
+        
+        # Collect by name, so the output does not depend on completion order
+        model_results = {
+            name: futures[name].result() if futures else func(*func_args)
+            for name, (func, func_args) in model_tasks.items()
+        }
+    
+    missing = [np.nan] * len(forecast_dates)
+    prophet_forecast_vals = model_results['prophet']
+    arima_forecast_vals = model_results['arima']
+    sarima_forecast_vals = model_results['sarima']
+    neural_prophet_forecast_vals = model_results.get('neural_prophet', missing)
+    darts_forecast_vals = model_results.get('darts', missing)
     
     # Ensemble forecast
     if getattr(args, 'ensemble', False):
@@ -924,54 +1739,166 @@ def main() -> None:
     else:
         ensemble_forecast_vals = [np.nan] * len(forecast_dates)
 
-    # Fill forecast columns: NaN for input dates, forecast for forecasted dates
-    out_df['sma'] = np.nan
-    out_df['es'] = np.nan
-    out_df['hw'] = np.nan
-    out_df['arima'] = np.nan
-    out_df['sarima'] = np.nan
-    out_df['theta'] = np.nan
-    out_df['prophet'] = np.nan
-    out_df['neural_prophet'] = np.nan
-    out_df['darts'] = np.nan
-    out_df['ensemble'] = np.nan
-
-    forecast_mask = out_df[date_col].isin(forecast_dates)
-    out_df.loc[forecast_mask, 'sma'] = sma_forecast
-    out_df.loc[forecast_mask, 'es'] = es_forecast
-    out_df.loc[forecast_mask, 'hw'] = hw_forecast
-    out_df.loc[forecast_mask, 'arima'] = arima_forecast_vals
-    out_df.loc[forecast_mask, 'sarima'] = sarima_forecast_vals
-    out_df.loc[forecast_mask, 'theta'] = theta_forecast_vals
-    out_df.loc[forecast_mask, 'prophet'] = prophet_forecast_vals
-    out_df.loc[forecast_mask, 'neural_prophet'] = neural_prophet_forecast_vals
-    out_df.loc[forecast_mask, 'darts'] = darts_forecast_vals
-    out_df.loc[forecast_mask, 'ensemble'] = ensemble_forecast_vals
+    # Forecast dates all follow last_date, so the output is the (sorted) input
+    # rows followed by the forecast rows. All forecast columns share one
+    # preallocated block that is NaN for the input rows
+    forecast_values = [
+        sma_forecast, es_forecast, hw_forecast, arima_forecast_vals, sarima_forecast_vals,
+        theta_forecast_vals, prophet_forecast_vals, neural_prophet_forecast_vals,
+        darts_forecast_vals, ensemble_forecast_vals
+    ]
+    n_actual = len(df)
+    forecast_block = np.full((n_actual + len(forecast_dates), len(FORECAST_COLUMNS)), np.nan)
+    for i, values in enumerate(forecast_values):
+        forecast_block[n_actual:, i] = values
+    out_df = pd.DataFrame(forecast_block, columns=FORECAST_COLUMNS)
+    # Input and forecast dates are each sorted and disjoint, so the columns are plain concatenations
+    out_df.insert(0, date_col, np.concatenate([
+        df[date_col].to_numpy(), pd.DatetimeIndex(forecast_dates).to_numpy()
+    ]))
+    out_df.insert(1, value_col, np.concatenate([
+        df[value_col].to_numpy(), np.full(len(forecast_dates), np.nan, dtype=df[value_col].dtype)
+    ]))
+    forecast_df = out_df.iloc[n_actual:]
 
-    # Output as CSV to stdout (for Excel graphing)
-    out_df.to_csv(sys.stdout, index=False)
+    algorithms = ['sma', 'es', 'hw', 'arima', 'sarima', 'theta', 'prophet']
+    if getattr(args, 'neural_prophet', False):
+        algorithms.append('neural_prophet')
+    if getattr(args, 'darts_algorithm', None):
+        algorithms.append('darts')
+    if getattr(args, 'ensemble', False):
+        algorithms.append('ensemble')
 
-    # If milestone summary requested, print it after the CSV
+    summary = None
     if getattr(args, 'milestone_summary', False):
-        print("\n# Forecast Milestone Summary\n", file=sys.stdout)
         milestones = get_milestone_dates(last_date, granularity)
-        forecast_only = out_df[forecast_mask].copy()
-        forecast_only[date_col] = pd.to_datetime(forecast_only[date_col])
-        for label, mdate in milestones.items():
-            # For each algorithm, sum forecasted values up to and including the milestone date
-            mask = forecast_only[date_col] <= pd.Timestamp(mdate)
-            print(f"{label} ({mdate}):", file=sys.stdout)
-            algorithms = ['sma', 'es', 'hw', 'arima', 'sarima', 'theta', 'prophet']
-            if getattr(args, 'neural_prophet', False):
-                algorithms.append('neural_prophet')
-            if getattr(args, 'darts_algorithm', None):
-                algorithms.append('darts')
-            if getattr(args, 'ensemble', False):
-                algorithms.append('ensemble')
-            for algo in algorithms:
-                total = forecast_only.loc[mask, algo].sum()
-                print(f"  {algo}: {total:.2f}", file=sys.stdout)
-            print("", file=sys.stdout)
+        summary = summarize_milestones(forecast_df, date_col, milestones, algorithms)
+    return out_df, summary
+
+def warm_worker_imports() -> None:
+    """Import Prophet once per worker process so the first group does not pay for it."""
+    # Forked workers (the Linux default) inherit main()'s warning filters, but
+    # under the spawn or forkserver start methods (macOS, Windows, Python 3.14+
+    # on Linux) the worker starts a fresh interpreter and only imports this
+    # module, so the filters must be installed again here
+    quiet_model_libraries()
+    try:
+        import prophet  # noqa: F401
+    except ImportError:
+        pass
+
+def group_worker_counts(jobs: Optional[int], n_groups: int) -> Tuple[int, int]:
+    """
+    Split the --jobs budget between group processes and per-series fit threads.
+    
+    Every group process runs its own forecaster thread pool, so the number of
+    concurrent model fits is processes x threads; both are chosen so that the
+    product stays within the budget.
+    
+    Args:
+        jobs: --jobs value, or None for one fit per CPU
+        n_groups: Number of groups to forecast
+        
+    Returns:
+        Tuple of (worker processes, fit threads per series)
+    """
+    budget = jobs or os.cpu_count() or 1
+    workers = max(1, min(n_groups, budget))
+    return workers, max(1, budget // workers)
+
+def forecast_groups(df: pd.DataFrame, args) -> Tuple[pd.DataFrame, Optional[Dict[Any, Dict[str, Dict[str, Any]]]]]:
+    """
+    Forecast each group of --group-column as its own series in worker processes.
+    
+    The --jobs budget (one per CPU by default) is split between the processes
+    and each series' forecaster threads by group_worker_counts.
+    
+    Args:
+        df: Cleaned DataFrame from load_data, including the group column
+        args: Parsed command line arguments
+        
+    Returns:
+        Tuple of the concatenated output tables (group as the first column) and
+        the milestone summaries keyed by group, or None without --milestone-summary
+        
+    Raises:
+        SystemExit: If a group has fewer than MIN_DATA_POINTS rows
+    """
+    group_col = args.group_column
+    names, frames = [], []
+    for name, group in df.groupby(group_col, sort=False):
+        if len(group) < MIN_DATA_POINTS:
+            handle_error(f"Not enough data to forecast group '{name}'. At least {MIN_DATA_POINTS} dates are required.", 3)
+        names.append(name)
+        frames.append(group.drop(columns=group_col).reset_index(drop=True))
+    
+    workers, threads = group_worker_counts(getattr(args, 'jobs', None), len(frames))
+    series_args = argparse.Namespace(**{**vars(args), 'jobs': threads})
+    if workers == 1:
+        results = [forecast_series(frame, series_args) for frame in frames]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_worker_imports) as executor:
+            results = list(executor.map(forecast_series, frames, [series_args] * len(frames)))
+    
+    outputs = []
+    for name, (out_df, _) in zip(names, results):
+        out_df.insert(0, group_col, name)
+        outputs.append(out_df)
+    summaries = None
+    if getattr(args, 'milestone_summary', False):
+        summaries = {name: summary for name, (_, summary) in zip(names, results)}
+    return pd.concat(outputs, ignore_index=True), summaries
+
+def print_milestone_summary(summary: Dict[str, Dict[str, Any]], title: str = "Forecast Milestone Summary") -> None:
+    """
+    Print a milestone summary as plain text after the CSV output.
+    
+    Args:
+        summary: Milestone summary from summarize_milestones
+        title: Heading printed above the milestones
+    """
+    print(f"\n# {title}\n", file=sys.stdout)
+    for label, entry in summary.items():
+        print(f"{label} ({entry['date']}):", file=sys.stdout)
+        for algo, total in entry['totals'].items():
+            print(f"  {algo}: {total:.2f}", file=sys.stdout)
+        print("", file=sys.stdout)
+
+def main() -> None:
+    """Main entry point for the CLI tool."""
+    parser = create_argument_parser()
+    args = parser.parse_args()
+    quiet_model_libraries()
+    if args.jobs is not None and args.jobs < 1:
+        handle_error("--jobs must be at least 1.", 1)
+    
+    # Load and validate data
+    df = load_data(args)
+    if getattr(args, 'group_column', None):
+        out_df, summaries = forecast_groups(df, args)
+        if getattr(args, 'output_format', DEFAULT_OUTPUT_FORMAT) == 'json':
+            write_json_forecast(out_df, summaries, grouped=True)
+            return
+        write_csv_output(out_df)
+        if summaries is not None:
+            for name, summary in summaries.items():
+                print_milestone_summary(summary, f"Forecast Milestone Summary: {name}")
+        return
+    
+    if len(df) < MIN_DATA_POINTS:
+        handle_error(f"Not enough data to forecast. At least {MIN_DATA_POINTS} dates are required.", 3)
+    out_df, summary = forecast_series(df, args)
+
+    if getattr(args, 'output_format', DEFAULT_OUTPUT_FORMAT) == 'json':
+        write_json_forecast(out_df, summary)
+        return
+
+    # Output as CSV to stdout (for Excel graphing)
+    write_csv_output(out_df)
+
+    # If milestone summary requested, print it after the CSV
+    if summary is not None:
+        print_milestone_summary(summary)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# Shared fixtures for the test suite.
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_forecast_cache(tmp_path, monkeypatch):
+    """Point the forecast_costs on-disk caches at a per-test directory.
+
+    Keeps the suite out of ~/.cache/finops-toolkit and stops memoized results
+    from leaking between tests or runs. CLI tests pass os.environ on to their
+    subprocesses, so those use the same directory.
+    """
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setenv('FORECAST_CACHE_DIR', str(cache_dir))
+    monkeypatch.delenv('FORECAST_NO_CACHE', raising=False)
+    return cache_dir
@@ -51,6 +51,8 @@ from aws.anomaly_detection_forecast import (
     run_cost_and_usage,
     run_forecast_costs,
     percent_diff,
+    index_forecasts_by_date,
+    lookup_forecast_values,
     PERIODS,
     METHODS,
     GROUP_COLS,
@@ -160,6 +162,34 @@ class TestPercentDiff:
         assert result is None
 
 
+class TestLookupForecastValues:
+    """Test the index_forecasts_by_date and lookup_forecast_values functions."""
+    
+    def _forecast_csv(self):
+        import pandas as pd
+        return pd.read_csv(StringIO(
+            "PeriodStart,Value,sma\n"
+            "2025-01-01,10,\n"
+            "2025-01-02,,12.5\n"
+            "2025-01-03,,13.5\n"
+        ))
+    
+    def test_lookup_forecast_values_string_dates(self):
+        """Test lookups match CSV string dates against parsed dates."""
+        import pandas as pd
+        indexed = index_forecasts_by_date(self._forecast_csv())
+        lookup_dates = pd.DatetimeIndex(['2025-01-03', '2025-01-02', '2025-01-01', '2024-12-01'])
+        result = lookup_forecast_values(indexed, 'sma', lookup_dates)
+        assert result == [13.5, 12.5, None, None]
+    
+    def test_lookup_forecast_values_missing_method(self):
+        """Test lookups for a method absent from the forecast output."""
+        import pandas as pd
+        indexed = index_forecasts_by_date(self._forecast_csv())
+        lookup_dates = pd.DatetimeIndex(['2025-01-02', '2025-01-03'])
+        assert lookup_forecast_values(indexed, 'prophet', lookup_dates) == [None, None]
+
+
 class TestCommandLineInterface:
     """Test the command-line interface."""
     
@@ -174,6 +204,16 @@ class TestCommandLineInterface:
         assert "--threshold" in result.stdout
         assert "Examples:" in result.stdout
     
+    def test_runs_without_pythonpath(self):
+        """Test the script runs directly, without the repo root on PYTHONPATH."""
+        env = {key: value for key, value in os.environ.items() if key != 'PYTHONPATH'}
+        result = subprocess.run([
+            sys.executable, "aws/anomaly_detection_forecast.py", "--help"
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=env)
+        
+        assert result.returncode == 0, result.stderr
+        assert "--threshold" in result.stdout
+    
     def test_missing_required_argument(self):
         """Test that missing required argument causes error."""
         result = subprocess.run([
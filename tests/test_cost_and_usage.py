@@ -266,6 +266,19 @@ class TestWriteCsvOutput:
         # Should not have header
         assert len(lines) == 1
         assert "2024-12-01,EC2,10.5" in lines[0]
+    
+    def test_write_csv_output_keeps_order_with_text(self, capsys):
+        """Test CSV written to the binary buffer stays between surrounding text."""
+        import pandas as pd
+        
+        df = pd.DataFrame({'PeriodStart': ['2024-12-01'], 'UnblendedCost': [1.5]})
+        
+        print("before")
+        write_csv_output(df)
+        print("after")
+        
+        captured = capsys.readouterr()
+        assert captured.out.split('\n')[:4] == ["before", "PeriodStart,UnblendedCost", "2024-12-01,1.5", "after"]
 
 
 class TestPrintCsvSummary:
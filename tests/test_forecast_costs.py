@@ -32,6 +32,7 @@ This module tests the forecast_costs command functionality including:
 - Pipe compatibility
 """
 
+import logging
 import pytest
 import subprocess
 import sys
@@ -50,9 +51,12 @@ from forecast_costs import (
     read_input_from_stdin,
     validate_required_columns,
     load_data,
+    parse_date_column,
     infer_granularity,
     get_forecast_dates,
     get_milestone_dates,
+    get_value_array,
+    moving_average_level,
     simple_moving_average_forecast,
     exponential_smoothing_forecast,
     holt_winters_forecast,
@@ -64,7 +68,17 @@ from forecast_costs import (
     ensemble_forecast,
     parse_order_parameter,
     prophet_forecast,
+    resolve_prophet_seasonality,
+    summarize_milestones,
+    trim_forecast_cache,
+    group_worker_counts,
+    forecast_groups,
+    forecast_series,
+    write_load_cache,
+    get_forecast_memory,
+    is_constant_series,
     MIN_DATA_POINTS,
+    NUMBA_MIN_POINTS,
     DEFAULT_SMA_WINDOW,
     DEFAULT_ES_ALPHA,
     DEFAULT_HW_ALPHA,
@@ -129,6 +143,7 @@ class TestCreateArgumentParser:
         assert args.input is None
         assert args.sma_window == DEFAULT_SMA_WINDOW
         assert args.es_alpha == DEFAULT_ES_ALPHA
+        assert args.es_model == 'simple'
         assert args.hw_alpha == DEFAULT_HW_ALPHA
         assert args.hw_beta == DEFAULT_HW_BETA
         assert args.hw_gamma == DEFAULT_HW_GAMMA
@@ -143,7 +158,13 @@ class TestCreateArgumentParser:
         assert args.prophet_daily_seasonality is True
         assert args.prophet_yearly_seasonality is True
         assert args.prophet_weekly_seasonality is False
+        assert args.prophet_uncertainty_samples == 0
+        assert args.prophet_n_changepoints == 25
         assert args.milestone_summary is False
+        assert args.precision == 'fp64'
+        assert args.output_format == 'csv'
+        assert args.no_cache is False
+        assert args.no_prophet_cache is False
 
 
 class TestReadInputFromFile:
@@ -173,6 +194,21 @@ class TestReadInputFromFile:
             
             # Clean up
             os.unlink(tmp_file.name)
+    
+    def test_read_input_from_file_usecols(self, tmp_path):
+        """Test only the requested columns are kept from a wide file."""
+        test_csv = tmp_path / 'wide.csv'
+        test_csv.write_text("PeriodStart,Service,UnblendedCost\n2024-01-01,EC2,10\n2024-01-02,S3,20\n")
+        df = read_input_from_file(str(test_csv), ['PeriodStart', 'UnblendedCost'])
+        assert list(df.columns) == ['PeriodStart', 'UnblendedCost']
+        assert df['UnblendedCost'].tolist() == [10, 20]
+    
+    def test_read_input_from_file_usecols_missing_column(self, tmp_path):
+        """Test absent usecols are left for column validation to report."""
+        test_csv = tmp_path / 'costs.csv'
+        test_csv.write_text("PeriodStart,Cost\n2024-01-01,10\n")
+        df = read_input_from_file(str(test_csv), ['PeriodStart', 'UnblendedCost'])
+        assert list(df.columns) == ['PeriodStart']
 
 
 class TestReadInputFromStdin:
@@ -198,6 +234,26 @@ class TestReadInputFromStdin:
                 assert exc_info.value.code == 1
                 captured = capsys.readouterr()
                 assert "Failed to parse input data" in captured.err
+    
+    def test_read_input_from_stdin_chunked(self):
+        """Test chunks are stitched back together with only the requested columns."""
+        rows = "".join(f"2024-01-{day:02d},EC2,{day}\n" for day in range(1, 11))
+        with patch("sys.stdin", StringIO("PeriodStart,Service,UnblendedCost\n" + rows)):
+            with patch("forecast_costs.STDIN_CHUNKSIZE", 3):
+                df = read_input_from_stdin(['PeriodStart', 'UnblendedCost'])
+        
+        assert list(df.columns) == ['PeriodStart', 'UnblendedCost']
+        assert df['UnblendedCost'].tolist() == list(range(1, 11))
+        assert list(df.index) == list(range(10))
+    
+    def test_read_input_from_stdin_header_only(self, capsys):
+        """Test a header without rows is reported as empty input."""
+        with patch("sys.stdin", StringIO("PeriodStart,UnblendedCost\n")):
+            with pytest.raises(SystemExit) as exc_info:
+                read_input_from_stdin()
+        
+        assert exc_info.value.code == 1
+        assert "Input data is empty" in capsys.readouterr().err
 
 
 class TestValidateRequiredColumns:
@@ -228,6 +284,140 @@ class TestValidateRequiredColumns:
         assert "Missing required columns: UnblendedCost" in captured.err
 
 
+class TestParseDateColumn:
+    """Test the parse_date_column function."""
+    
+    def test_parse_date_column_iso(self):
+        """Test parse_date_column with ISO 8601 dates."""
+        import pandas as pd
+        result = parse_date_column(pd.Series(['2025-01-01', '2025-01-02T00:00:00']))
+        assert list(result) == [pd.Timestamp('2025-01-01'), pd.Timestamp('2025-01-02')]
+    
+    def test_parse_date_column_non_iso_fallback(self):
+        """Test parse_date_column falls back to inference for non-ISO dates."""
+        import pandas as pd
+        result = parse_date_column(pd.Series(['2025-01-01', '01/15/2025', 'not a date']))
+        assert result.iloc[0] == pd.Timestamp('2025-01-01')
+        assert result.iloc[1] == pd.Timestamp('2025-01-15')
+        assert pd.isna(result.iloc[2])
+
+
+class TestLoadData:
+    """Test the load_data function."""
+    
+    def _args(self, path, **overrides):
+        parser = create_argument_parser()
+        argv = ["--input", path, "--date-column", "PeriodStart", "--value-column", "UnblendedCost"]
+        for flag, value in overrides.items():
+            argv += [f"--{flag.replace('_', '-')}", value]
+        return parser.parse_args(argv)
+    
+    def test_load_data_default_precision(self):
+        """Test load_data keeps the value column in float64 by default."""
+        import numpy as np
+        test_csv = os.path.join(os.path.dirname(__file__), 'input', 'daily_costs_simple.csv')
+        df = load_data(self._args(test_csv))
+        assert df['UnblendedCost'].dtype == np.float64
+    
+    def test_load_data_fp32_precision(self):
+        """Test load_data downcasts the value column when --precision fp32 is used."""
+        import numpy as np
+        test_csv = os.path.join(os.path.dirname(__file__), 'input', 'daily_costs_simple.csv')
+        df = load_data(self._args(test_csv, precision='fp32'))
+        assert df['UnblendedCost'].dtype == np.float32
+        assert df['UnblendedCost'].iloc[0] == 10.0
+    
+    def test_load_data_cleans_and_sorts(self, tmp_path):
+        """Test unparseable rows are dropped and the rest sorted by date."""
+        test_csv = tmp_path / 'costs.csv'
+        test_csv.write_text(
+            "PeriodStart,Service,UnblendedCost\n"
+            "2024-01-03,EC2,3\n"
+            "not-a-date,EC2,9\n"
+            "2024-01-01,EC2,n/a\n"
+            "2024-01-02,S3,2\n"
+        )
+        df = load_data(self._args(str(test_csv)))
+        assert list(df.columns) == ['PeriodStart', 'UnblendedCost']
+        assert df['UnblendedCost'].tolist() == [2.0, 3.0]
+        assert df['PeriodStart'].is_monotonic_increasing
+    
+    def test_load_data_stable_sort(self, tmp_path):
+        """Test rows sharing a date keep their input order and the index is reset."""
+        test_csv = tmp_path / 'costs.csv'
+        test_csv.write_text(
+            "PeriodStart,UnblendedCost\n"
+            "2024-01-02,5\n"
+            "2024-01-01,4\n"
+            "2024-01-02,1\n"
+            "2024-01-01,\n"
+            "2024-01-01,7\n"
+        )
+        df = load_data(self._args(str(test_csv)))
+        assert df['UnblendedCost'].tolist() == [4.0, 7.0, 5.0, 1.0]
+        assert df.index.tolist() == [0, 1, 2, 3]
+    
+    def test_load_data_cache_roundtrip(self, tmp_path):
+        """Test a warm load returns the cached frame and an edit invalidates it."""
+        import pandas as pd
+        pytest.importorskip('pyarrow')
+        test_csv = tmp_path / 'costs.csv'
+        test_csv.write_text("PeriodStart,UnblendedCost\n2024-01-02,2\n2024-01-01,1\n")
+        
+        cold = load_data(self._args(str(test_csv)))
+        assert len(list((tmp_path / 'cache').iterdir())) == 1
+        warm = load_data(self._args(str(test_csv)))
+        pd.testing.assert_frame_equal(cold, warm)
+        
+        test_csv.write_text("PeriodStart,UnblendedCost\n2024-01-01,1\n2024-01-02,2\n2024-01-03,3\n")
+        assert len(load_data(self._args(str(test_csv)))) == 3
+    
+    def test_load_data_cache_evicts_least_recently_used(self, tmp_path):
+        """Test the load cache keeps LOAD_CACHE_MAX_ITEMS entries, evicting by last use."""
+        pytest.importorskip('pyarrow')
+        paths = []
+        for i in range(3):
+            test_csv = tmp_path / f'costs{i}.csv'
+            test_csv.write_text(f"PeriodStart,UnblendedCost\n2024-01-01,{i}\n")
+            paths.append(str(test_csv))
+        
+        with patch('forecast_costs.LOAD_CACHE_MAX_ITEMS', 2):
+            load_data(self._args(paths[0]))
+            first_entry = next((tmp_path / 'cache').iterdir())
+            load_data(self._args(paths[1]))
+            os.utime(first_entry, ns=(1, 1))
+            # A hit on the first input makes it the most recently used entry
+            load_data(self._args(paths[0]))
+            load_data(self._args(paths[2]))
+        
+        entries = list((tmp_path / 'cache').iterdir())
+        assert len(entries) == 2
+        assert first_entry in entries
+    
+    def test_write_load_cache_failure_removes_tmp(self, tmp_path):
+        """Test a failed parquet write leaves no temporary file behind."""
+        import pandas as pd
+        cache_path = str(tmp_path / 'cache' / 'entry.parquet')
+        
+        def failing_to_parquet(self, path, *args, **kwargs):
+            with open(path, 'wb') as f:
+                f.write(b'partial')
+            raise OSError("disk full")
+        
+        with patch.object(pd.DataFrame, 'to_parquet', failing_to_parquet):
+            write_load_cache(pd.DataFrame({'a': [1.0]}), cache_path)
+        assert list((tmp_path / 'cache').iterdir()) == []
+    
+    def test_load_data_no_cache(self, tmp_path):
+        """Test --no-cache neither reads nor writes the cache."""
+        test_csv = os.path.join(os.path.dirname(__file__), 'input', 'daily_costs_simple.csv')
+        args = create_argument_parser().parse_args([
+            "--input", test_csv, "--date-column", "PeriodStart", "--value-column", "UnblendedCost", "--no-cache"
+        ])
+        load_data(args)
+        assert not (tmp_path / 'cache').exists()
+
+
 class TestInferGranularity:
     """Test the infer_granularity function."""
     
@@ -248,6 +438,19 @@ class TestInferGranularity:
         })
         result = infer_granularity(df, 'date')
         assert result == 'daily'
+    
+    def test_infer_granularity_month_end(self):
+        """Test month-end dates are still recognised as monthly."""
+        import pandas as pd
+        df = pd.DataFrame({'date': pd.date_range('2023-01-31', periods=12, freq='ME')})
+        assert infer_granularity(df, 'date') == 'monthly'
+    
+    def test_infer_granularity_daily_skips_infer_freq(self):
+        """Test a short first gap decides daily without scanning the series."""
+        import pandas as pd
+        df = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=2000, freq='D')})
+        with patch('pandas.infer_freq', side_effect=AssertionError('scanned')):
+            assert infer_granularity(df, 'date') == 'daily'
 
 
 class TestGetForecastDates:
@@ -272,6 +475,44 @@ class TestGetForecastDates:
         assert len(dates) == 12
         assert dates[0] == pd.Timestamp('2024-02-01')
         assert dates[-1] == pd.Timestamp('2025-01-01')
+    
+    def test_get_forecast_dates_monthly_from_month_end(self):
+        """Test monthly dates start at the next month even from a month end."""
+        import pandas as pd
+        dates = get_forecast_dates(pd.Timestamp('2024-01-31'), 'monthly')
+        assert isinstance(dates, pd.DatetimeIndex)
+        assert list(dates[:2]) == [pd.Timestamp('2024-02-01'), pd.Timestamp('2024-03-01')]
+
+
+class TestGetValueArray:
+    """Test the get_value_array function."""
+    
+    def test_get_value_array_nullable(self):
+        """Test nullable columns become contiguous float64 with NaN."""
+        import pandas as pd
+        import numpy as np
+        df = pd.DataFrame({'value': pd.array([1.5, None, 3.0], dtype='Float64')})
+        result = get_value_array(df, 'value')
+        assert result.dtype == np.float64
+        assert result.flags['C_CONTIGUOUS']
+        assert np.isnan(result[1])
+    
+    def test_get_value_array_keeps_fp32(self):
+        """Test float32 columns stay float32 unless a dtype is forced."""
+        import pandas as pd
+        import numpy as np
+        df = pd.DataFrame({'value': np.array([1.0, 2.0], dtype=np.float32)})
+        assert get_value_array(df, 'value').dtype == np.float32
+        assert get_value_array(df, 'value', np.float64).dtype == np.float64
+    
+    def test_get_value_array_shares_float64_buffer(self):
+        """Test float64 columns are returned without a copy, so every forecaster reads one buffer."""
+        import pandas as pd
+        import numpy as np
+        df = pd.DataFrame({'value': np.linspace(1.0, 2.0, 10)})
+        first = get_value_array(df, 'value', np.float64)
+        second = get_value_array(df, 'value', np.float64)
+        assert np.shares_memory(first, second)
 
 
 class TestSimpleMovingAverageForecast:
@@ -291,6 +532,27 @@ class TestSimpleMovingAverageForecast:
         assert len(result) == 2
         assert result[0] == 40.0
         assert result[1] == 40.0
+    
+    def test_moving_average_level_skips_nan(self):
+        """Test NaN in the final window are ignored."""
+        import numpy as np
+        assert moving_average_level(np.array([100.0, 10.0, np.nan, 20.0]), 3) == 15.0
+        assert np.isnan(moving_average_level(np.array([1.0, np.nan]), 1))
+    
+    def test_simple_moving_average_short_series(self):
+        """Test a window longer than the series averages every value."""
+        import pandas as pd
+        df = pd.DataFrame({'value': [10.0, 20.0]})
+        result = simple_moving_average_forecast(df, 'value', [pd.Timestamp('2024-01-03')], 7)
+        assert result[0] == 15.0
+    
+    def test_simple_moving_average_empty(self):
+        """Test an empty series yields NaN forecasts."""
+        import pandas as pd
+        import numpy as np
+        df = pd.DataFrame({'value': pd.Series([], dtype=float)})
+        result = simple_moving_average_forecast(df, 'value', [pd.Timestamp('2024-01-01')], 3)
+        assert np.isnan(result[0])
 
 
 class TestExponentialSmoothingForecast:
@@ -299,6 +561,7 @@ class TestExponentialSmoothingForecast:
     def test_exponential_smoothing_forecast(self):
         """Test exponential_smoothing_forecast calculation."""
         import pandas as pd
+        import numpy as np
         df = pd.DataFrame({
             'value': [10, 20, 30, 40, 50]
         })
@@ -309,6 +572,68 @@ class TestExponentialSmoothingForecast:
         # Should return a list with one value
         assert len(result) == 1
         assert isinstance(result[0], float)
+        assert result.dtype == np.float64
+    
+    def test_exponential_smoothing_matches_recurrence(self):
+        """Test the closed form matches the step-by-step recurrence."""
+        import pandas as pd
+        import numpy as np
+        values = np.random.default_rng(0).uniform(50, 150, size=500)
+        df = pd.DataFrame({'value': values})
+        expected = values[0]
+        for v in values[1:]:
+            expected = 0.3 * v + 0.7 * expected
+        
+        result = exponential_smoothing_forecast(df, 'value', [pd.Timestamp('2024-01-01')], 0.3)
+        
+        assert result[0] == pytest.approx(expected, rel=1e-12)
+    
+    def test_exponential_smoothing_numba_matches_closed_form(self):
+        """Test the numba path on long series agrees with the closed form."""
+        import pandas as pd
+        import numpy as np
+        pytest.importorskip('numba')
+        values = np.random.default_rng(1).uniform(50, 150, size=NUMBA_MIN_POINTS + 1)
+        df = pd.DataFrame({'value': values})
+        weights = np.power(0.7, np.arange(len(values) - 1, -1, -1))
+        expected = weights[0] * values[0] + 0.3 * np.dot(weights[1:], values[1:])
+        
+        result = exponential_smoothing_forecast(df, 'value', [pd.Timestamp('2024-01-01')], 0.3)
+        
+        assert result[0] == pytest.approx(expected, rel=1e-9)
+    
+    def test_exponential_smoothing_single_value(self):
+        """Test a single observation is returned unchanged."""
+        import pandas as pd
+        df = pd.DataFrame({'value': [42.0]})
+        result = exponential_smoothing_forecast(df, 'value', [pd.Timestamp('2024-01-02')], 0.5)
+        assert list(result) == [42.0]
+    
+    def test_exponential_smoothing_holt_disabled(self, monkeypatch):
+        """Test holt model returns NaN when statsmodels usage is disabled."""
+        import pandas as pd
+        import numpy as np
+        monkeypatch.delenv('ENABLE_STATSMODELS', raising=False)
+        df = pd.DataFrame({'value': [10, 20, 30, 40, 50]})
+        forecast_dates = [pd.Timestamp('2024-01-06'), pd.Timestamp('2024-01-07')]
+        
+        result = exponential_smoothing_forecast(df, 'value', forecast_dates, 0.3, model='holt')
+        
+        assert len(result) == 2
+        assert all(np.isnan(v) for v in result)
+    
+    def test_exponential_smoothing_holt_follows_trend(self, monkeypatch):
+        """Test holt model extrapolates a linear trend."""
+        import pandas as pd
+        pytest.importorskip('statsmodels')
+        monkeypatch.setenv('ENABLE_STATSMODELS', '1')
+        df = pd.DataFrame({'value': [10.0 * i for i in range(1, 21)]})
+        forecast_dates = [pd.Timestamp('2024-01-21'), pd.Timestamp('2024-01-22')]
+        
+        result = exponential_smoothing_forecast(df, 'value', forecast_dates, 0.3, model='holt')
+        
+        assert result[0] == pytest.approx(210.0, rel=0.01)
+        assert result[1] == pytest.approx(220.0, rel=0.01)
 
 
 class TestHoltWintersForecast:
@@ -385,6 +710,43 @@ class TestHoltWintersForecast:
         assert len(result) == 1
         assert not np.isnan(result[0])
         assert isinstance(result[0], float)
+    
+    def test_holt_winters_forecast_all_zero_series(self):
+        """Test an all-zero series forecasts zero instead of dividing by zero."""
+        import pandas as pd
+        df = pd.DataFrame({'value': [0.0] * 30})
+        forecast_dates = [pd.Timestamp('2024-01-31'), pd.Timestamp('2024-02-01')]
+        
+        result = holt_winters_forecast(df, 'value', forecast_dates, 0.3, 0.1, 0.1, 12)
+        
+        assert result == [0.0, 0.0]
+    
+    def test_is_constant_series(self):
+        """Test flat series are detected, relative to their level."""
+        import numpy as np
+        assert is_constant_series(np.full(10, 42.5))
+        assert is_constant_series(np.zeros(3))
+        assert not is_constant_series(np.array([1.0, 1.0, 1.0001]))
+        assert not is_constant_series(np.array([1.0, np.nan]))
+        assert not is_constant_series(np.array([]))
+    
+    def test_holt_winters_numba_matches_python_loop(self, monkeypatch):
+        """Test the numba path on long series agrees with the Python recurrence."""
+        import pandas as pd
+        import numpy as np
+        import forecast_costs
+        pytest.importorskip('numba')
+        n = NUMBA_MIN_POINTS + 1
+        season = np.tile(np.linspace(0.9, 1.1, 7), n // 7 + 1)[:n]
+        values = 100 * season + np.random.default_rng(2).uniform(0, 5, size=n)
+        df = pd.DataFrame({'value': values})
+        forecast_dates = list(pd.date_range('2024-01-01', periods=14))
+        
+        compiled = holt_winters_forecast(df, 'value', forecast_dates, 0.3, 0.1, 0.1, 7)
+        monkeypatch.setattr(forecast_costs, 'NUMBA_MIN_POINTS', n)
+        expected = holt_winters_forecast(df, 'value', forecast_dates, 0.3, 0.1, 0.1, 7)
+        
+        assert compiled == pytest.approx(expected, rel=1e-9)
 
 
 class TestArimaForecast:
@@ -434,6 +796,47 @@ class TestArimaForecast:
         
         assert len(result) == 1
         assert np.isnan(result[0])
+    
+    def test_arima_forecast_memoized(self, tmp_path, monkeypatch):
+        """Test a repeat ARIMA fit on the same data is served from the cache."""
+        import pandas as pd
+        import numpy as np
+        pytest.importorskip('statsmodels')
+        joblib = pytest.importorskip('joblib')
+        monkeypatch.setenv('ENABLE_STATSMODELS', '1')
+        memory = joblib.Memory(str(tmp_path / 'forecasts'), verbose=0)
+        df = pd.DataFrame({'value': 100.0 + np.sin(np.arange(40)) + np.arange(40)})
+        forecast_dates = list(pd.date_range('2024-02-10', periods=3, freq='D'))
+        
+        first = arima_forecast(df, 'value', forecast_dates, (1, 1, 0), memory)
+        with patch('statsmodels.tsa.arima.model.ARIMA', side_effect=AssertionError('refit')):
+            second = arima_forecast(df, 'value', forecast_dates, (1, 1, 0), memory)
+        
+        assert len(first) == 3
+        assert first == second
+    
+    def test_arima_forecast_constant_series_skips_fit(self, monkeypatch):
+        """Test a flat series is forecast as its last value without fitting."""
+        import pandas as pd
+        pytest.importorskip('statsmodels')
+        monkeypatch.setenv('ENABLE_STATSMODELS', '1')
+        df = pd.DataFrame({'value': [12.5] * 20})
+        forecast_dates = list(pd.date_range('2024-01-21', periods=2, freq='D'))
+        
+        with patch('statsmodels.tsa.arima.model.ARIMA', side_effect=AssertionError('fit')):
+            result = arima_forecast(df, 'value', forecast_dates, (1, 1, 1))
+        
+        assert result == [12.5, 12.5]
+    
+    def test_forecast_no_cache_env_disables_memory(self, tmp_path, monkeypatch):
+        """Test $FORECAST_NO_CACHE turns the forecast cache off like --no-cache."""
+        pytest.importorskip('joblib')
+        monkeypatch.setenv('FORECAST_CACHE_DIR', str(tmp_path / 'cache'))
+        args = create_argument_parser().parse_args(['--date-column', 'date', '--value-column', 'value'])
+        monkeypatch.delenv('FORECAST_NO_CACHE', raising=False)
+        assert get_forecast_memory(args) is not None
+        monkeypatch.setenv('FORECAST_NO_CACHE', '1')
+        assert get_forecast_memory(args) is None
 
 
 class TestSarimaForecast:
@@ -513,6 +916,165 @@ class TestThetaForecast:
         
         assert len(result) == 1
         assert result[0] == 10.0
+    
+    def test_theta_forecast_matches_polyfit_trend(self):
+        """Test the closed-form trend agrees with a degree-1 np.polyfit."""
+        import pandas as pd
+        import numpy as np
+        values = np.random.default_rng(4).uniform(50, 150, size=365) + 0.5 * np.arange(365)
+        df = pd.DataFrame({'value': values})
+        forecast_dates = list(pd.date_range('2025-01-01', periods=3, freq='D'))
+        x = np.arange(365)
+        slope, intercept = np.polyfit(x, values, 1)
+        trend = slope * x + intercept
+        theta_line = 2.0 * (values - trend) + trend
+        offset = 2 * theta_line[-1] - theta_line[-2] - trend[-1]
+        expected = [slope * (364 + h) + intercept + offset for h in (1, 2, 3)]
+        
+        result = theta_forecast(df, 'value', forecast_dates, 2.0)
+        
+        assert result == pytest.approx(expected, rel=1e-12)
+
+
+class TestResolveProphetSeasonality:
+    """Test the resolve_prophet_seasonality function."""
+    
+    def test_short_daily_series_drops_yearly(self):
+        """Test yearly seasonality needs two years of history."""
+        import pandas as pd
+        df = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=60, freq='D')})
+        assert resolve_prophet_seasonality(df, 'date', True, True, True) == (True, True, False)
+    
+    def test_monthly_series_drops_daily_and_weekly(self):
+        """Test daily and weekly seasonality are dropped for monthly data."""
+        import pandas as pd
+        df = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=36, freq='MS')})
+        assert resolve_prophet_seasonality(df, 'date', True, True, True) == (False, False, True)
+    
+    def test_disabled_flags_stay_disabled(self):
+        """Test seasonality the user turned off is never turned on."""
+        import pandas as pd
+        df = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=1000, freq='D')})
+        assert resolve_prophet_seasonality(df, 'date', False, False, False) == (False, False, False)
+
+
+class TestProphetForecast:
+    """Test the prophet_forecast function."""
+    
+    def test_prophet_forecast_aligned_to_dates(self):
+        """Test one finite forecast is returned per forecast date, in order."""
+        import pandas as pd
+        import numpy as np
+        pytest.importorskip('prophet')
+        dates = pd.date_range('2024-01-01', periods=60, freq='D')
+        df = pd.DataFrame({'date': dates, 'value': np.linspace(100.0, 160.0, 60)})
+        forecast_dates = list(pd.date_range('2024-03-01', periods=5, freq='D'))
+        args = create_argument_parser().parse_args(['--date-column', 'date', '--value-column', 'value'])
+        
+        result = prophet_forecast(df, 'date', 'value', forecast_dates, args)
+        
+        assert result.dtype == np.float64
+        assert len(result) == 5
+        assert np.all(np.isfinite(result))
+        assert result[-1] > result[0]
+    
+    def test_model_library_noise_silenced_by_cli_only(self):
+        """Test importing leaves warnings alone and quiet_model_libraries filters them."""
+        # A fresh interpreter, since pytest resets warning filters around each test
+        script = (
+            "import logging, warnings, forecast_costs\n"
+            "def emitted():\n"
+            "    with warnings.catch_warnings(record=True) as caught:\n"
+            "        warnings.warn_explicit('noisy', UserWarning, 'forecaster.py', 1, module='prophet.forecaster')\n"
+            "        warnings.warn_explicit('kept', UserWarning, 'forecast_costs.py', 1, module='forecast_costs')\n"
+            "    return [str(w.message) for w in caught]\n"
+            "print(emitted(), logging.getLogger('cmdstanpy').level)\n"
+            "forecast_costs.quiet_model_libraries()\n"
+            "print(emitted(), logging.getLogger('cmdstanpy').level)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == ["['noisy', 'kept'] 0", f"['kept'] {logging.ERROR}"]
+    
+    def test_prophet_forecast_constant_series_skips_fit(self):
+        """Test a flat series is forecast as its last value without fitting Prophet."""
+        import pandas as pd
+        import numpy as np
+        pytest.importorskip('prophet')
+        dates = pd.date_range('2024-01-01', periods=30, freq='D')
+        df = pd.DataFrame({'date': dates, 'value': np.full(30, 7.0)})
+        forecast_dates = list(pd.date_range('2024-01-31', periods=3, freq='D'))
+        args = create_argument_parser().parse_args(['--date-column', 'date', '--value-column', 'value'])
+        
+        with patch('prophet.Prophet', side_effect=AssertionError('fit')):
+            result = prophet_forecast(df, 'date', 'value', forecast_dates, args)
+        
+        np.testing.assert_array_equal(result, [7.0, 7.0, 7.0])
+    
+    def test_prophet_forecast_memoized(self, tmp_path):
+        """Test a repeat run with the same data is served from the cache."""
+        import pandas as pd
+        import numpy as np
+        pytest.importorskip('prophet')
+        pytest.importorskip('joblib')
+        dates = pd.date_range('2024-01-01', periods=60, freq='D')
+        df = pd.DataFrame({'date': dates, 'value': np.linspace(100.0, 160.0, 60)})
+        forecast_dates = list(pd.date_range('2024-03-01', periods=5, freq='D'))
+        args = create_argument_parser().parse_args(['--date-column', 'date', '--value-column', 'value'])
+        
+        first = prophet_forecast(df, 'date', 'value', forecast_dates, args)
+        with patch('prophet.Prophet', side_effect=AssertionError('refit')):
+            second = prophet_forecast(df, 'date', 'value', forecast_dates, args)
+        
+        np.testing.assert_array_equal(first, second)
+        assert (tmp_path / 'cache' / 'forecasts').exists()
+    
+    def test_prophet_forecast_no_prophet_cache(self, tmp_path):
+        """Test --no-prophet-cache leaves the forecast cache untouched."""
+        import pandas as pd
+        import numpy as np
+        pytest.importorskip('prophet')
+        dates = pd.date_range('2024-01-01', periods=60, freq='D')
+        df = pd.DataFrame({'date': dates, 'value': np.linspace(100.0, 160.0, 60)})
+        forecast_dates = list(pd.date_range('2024-03-01', periods=5, freq='D'))
+        args = create_argument_parser().parse_args([
+            '--date-column', 'date', '--value-column', 'value', '--no-prophet-cache'
+        ])
+        
+        result = prophet_forecast(df, 'date', 'value', forecast_dates, args)
+        
+        assert len(result) == 5
+        assert not (tmp_path / 'cache' / 'forecasts').exists()
+    
+    def test_trim_forecast_cache_evicts_oldest(self, tmp_path):
+        """Test the forecast cache is trimmed to FORECAST_CACHE_MAX_ITEMS entries."""
+        joblib = pytest.importorskip('joblib')
+        memory = joblib.Memory(str(tmp_path / 'lru'), verbose=0)
+        square = memory.cache(lambda x: x * x)
+        for x in range(4):
+            square(x)
+        with patch('forecast_costs.FORECAST_CACHE_MAX_ITEMS', 2):
+            trim_forecast_cache(memory)
+        outputs = list((tmp_path / 'lru').rglob('output.pkl'))
+        assert len(outputs) == 2
+    
+    def test_prophet_forecast_n_changepoints(self):
+        """Test a reduced changepoint count still yields a full forecast."""
+        import pandas as pd
+        import numpy as np
+        pytest.importorskip('prophet')
+        dates = pd.date_range('2024-01-01', periods=60, freq='D')
+        df = pd.DataFrame({'date': dates, 'value': np.linspace(100.0, 160.0, 60)})
+        forecast_dates = list(pd.date_range('2024-03-01', periods=5, freq='D'))
+        args = create_argument_parser().parse_args([
+            '--date-column', 'date', '--value-column', 'value', '--prophet-n-changepoints', '5'
+        ])
+        
+        result = prophet_forecast(df, 'date', 'value', forecast_dates, args)
+        
+        assert len(result) == 5
+        assert np.all(np.isfinite(result))
 
 
 class TestNeuralProphetForecast:
@@ -684,6 +1246,163 @@ class TestEnsembleForecast:
         result = ensemble_forecast({})
         
         assert result == []
+    
+    def test_ensemble_forecast_all_nan_step_and_short_forecast(self):
+        """Test steps with no forecasts stay NaN and short forecasts are padded."""
+        import warnings
+        import numpy as np
+        
+        forecasts = {
+            'sma': [100.0, np.nan, 120.0],
+            'es': [110.0, np.nan],
+            'prophet': np.array([np.nan, np.nan, np.nan])
+        }
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = ensemble_forecast(forecasts)
+        
+        assert result[0] == 105.0
+        assert np.isnan(result[1])
+        assert result[2] == 120.0
+
+
+class TestGetMilestoneDates:
+    """Test the get_milestone_dates function."""
+    
+    def test_get_milestone_dates_mid_month(self):
+        """Test milestones roll forward from a mid-month date."""
+        import pandas as pd
+        from datetime import date
+        result = get_milestone_dates(pd.Timestamp('2024-05-15'), 'daily')
+        assert result == {
+            'end_of_this_month': date(2024, 5, 31),
+            'end_of_next_month': date(2024, 6, 30),
+            'end_of_next_quarter': date(2024, 6, 30),
+            'end_of_following_quarter': date(2024, 9, 30),
+            'end_of_year': date(2024, 12, 31)
+        }
+    
+    def test_get_milestone_dates_matches_pandas_offsets(self):
+        """Test every day of a leap year, including period ends, against pandas offsets."""
+        import pandas as pd
+        for last_date in pd.date_range('2023-12-30', '2025-01-02', freq='D'):
+            assert get_milestone_dates(last_date, 'daily') == {
+                'end_of_this_month': (last_date + pd.offsets.MonthEnd(1)).date(),
+                'end_of_next_month': (last_date + pd.offsets.MonthEnd(2)).date(),
+                'end_of_next_quarter': (last_date + pd.offsets.QuarterEnd(1)).date(),
+                'end_of_following_quarter': (last_date + pd.offsets.QuarterEnd(2)).date(),
+                'end_of_year': (last_date + pd.offsets.YearEnd(1)).date()
+            }
+    
+    def test_get_milestone_dates_same_for_monthly(self):
+        """Test monthly and daily granularity share milestones."""
+        import pandas as pd
+        last_date = pd.Timestamp('2024-12-01')
+        assert get_milestone_dates(last_date, 'monthly') == get_milestone_dates(last_date, 'daily')
+        assert get_milestone_dates(last_date, 'monthly')['end_of_year'].year == 2024
+
+
+class TestSummarizeMilestones:
+    """Test the summarize_milestones function."""
+    
+    def test_summarize_milestones(self):
+        """Test totals include forecasts up to and including each milestone."""
+        import pandas as pd
+        forecast_only = pd.DataFrame({
+            'date': pd.date_range('2024-01-30', periods=4),
+            'sma': [1.0, 2.0, 3.0, 4.0],
+            'es': [10.0, 10.0, 10.0, 10.0]
+        })
+        milestones = {
+            'end_of_this_month': pd.Timestamp('2024-01-31').date(),
+            'end_of_next_month': pd.Timestamp('2024-02-29').date()
+        }
+        
+        result = summarize_milestones(forecast_only, 'date', milestones, ['sma', 'es'])
+        
+        assert result['end_of_this_month']['totals'] == {'sma': 3.0, 'es': 20.0}
+        assert result['end_of_next_month']['totals'] == {'sma': 10.0, 'es': 40.0}
+        assert result['end_of_this_month']['date'] == milestones['end_of_this_month']
+    
+    def test_summarize_milestones_unsorted_with_nan(self):
+        """Test unsorted rows are totalled by date and NaN forecasts count as zero."""
+        import pandas as pd
+        import numpy as np
+        forecast_only = pd.DataFrame({
+            'date': pd.to_datetime(['2024-02-01', '2024-01-30', '2024-01-31', '2024-02-02']),
+            'sma': [3.0, 1.0, 2.0, 4.0],
+            'arima': [np.nan] * 4
+        })
+        milestones = {
+            'before_start': pd.Timestamp('2024-01-01').date(),
+            'end_of_this_month': pd.Timestamp('2024-01-31').date()
+        }
+        
+        result = summarize_milestones(forecast_only, 'date', milestones, ['sma', 'arima'])
+        
+        assert result['before_start']['totals'] == {'sma': 0.0, 'arima': 0.0}
+        assert result['end_of_this_month']['totals'] == {'sma': 3.0, 'arima': 0.0}
+
+
+class TestGroupWorkerCounts:
+    """Test how --jobs is split between group processes and forecaster threads."""
+    
+    def test_group_worker_counts_stay_within_budget(self):
+        """Test processes x threads never exceeds the --jobs budget."""
+        assert group_worker_counts(4, 2) == (2, 2)
+        assert group_worker_counts(4, 10) == (4, 1)
+        assert group_worker_counts(8, 3) == (3, 2)
+        assert group_worker_counts(1, 5) == (1, 1)
+        assert group_worker_counts(5, 1) == (1, 5)
+    
+    def test_group_worker_counts_default_is_one_fit_per_cpu(self):
+        """Test the default budget is the CPU count."""
+        with patch('forecast_costs.os.cpu_count', return_value=8):
+            assert group_worker_counts(None, 3) == (3, 2)
+            assert group_worker_counts(None, 20) == (8, 1)
+    
+    def test_forecast_groups_uses_split_counts(self):
+        """Test forecast_groups starts the split number of processes and threads."""
+        import pandas as pd
+        from concurrent.futures import ThreadPoolExecutor
+        df = pd.DataFrame({
+            'date': list(pd.date_range('2024-01-01', periods=MIN_DATA_POINTS)) * 2,
+            'value': 1.0,
+            'group': ['a'] * MIN_DATA_POINTS + ['b'] * MIN_DATA_POINTS
+        })
+        args = create_argument_parser().parse_args([
+            '--date-column', 'date', '--value-column', 'value', '--group-column', 'group', '--jobs', '4'
+        ])
+        pool_sizes, series_jobs = [], []
+        
+        def fake_process_pool(max_workers, initializer):
+            pool_sizes.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers)
+        
+        def fake_forecast_series(frame, series_args):
+            series_jobs.append(series_args.jobs)
+            return frame.copy(), None
+        
+        with patch('forecast_costs.ProcessPoolExecutor', fake_process_pool), \
+                patch('forecast_costs.forecast_series', fake_forecast_series):
+            out_df, _ = forecast_groups(df, args)
+        
+        assert pool_sizes == [2]
+        assert series_jobs == [2, 2]
+        assert args.jobs == 4
+        assert out_df['group'].tolist() == ['a'] * MIN_DATA_POINTS + ['b'] * MIN_DATA_POINTS
+    
+    def test_forecast_series_jobs_one_runs_without_threads(self):
+        """Test --jobs 1 never starts a forecaster thread pool."""
+        import pandas as pd
+        df = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=24, freq='MS'), 'value': 100.0})
+        args = create_argument_parser().parse_args([
+            '--date-column', 'date', '--value-column', 'value', '--jobs', '1', '--no-cache'
+        ])
+        with patch('forecast_costs.ThreadPoolExecutor', side_effect=AssertionError("thread pool started")):
+            out_df, _ = forecast_series(df, args)
+        assert out_df['sma'].notna().any()
 
 
 class TestParseOrderParameter:
@@ -707,6 +1426,16 @@ class TestParseOrderParameter:
             parse_order_parameter("1,a,3", 3)
         
         assert exc_info.value.code == 1
+    
+    def test_parse_order_parameter_defaults(self):
+        """Test that the default order strings return the default tuples."""
+        assert parse_order_parameter("1,1,1", 3) == (1, 1, 1)
+        assert parse_order_parameter("1,1,1,12", 4) == (1, 1, 1, 12)
+        
+        with pytest.raises(SystemExit) as exc_info:
+            parse_order_parameter("1,1,1,12", 3)
+        
+        assert exc_info.value.code == 1
 
 
 class TestCommandLineInterface:
@@ -716,7 +1445,7 @@ class TestCommandLineInterface:
         """Test that help output is generated correctly."""
         result = subprocess.run([
             sys.executable, "forecast_costs.py", "--help"
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert "Forecast AWS costs using SMA, Exponential Smoothing, and Prophet" in result.stdout
@@ -738,7 +1467,7 @@ class TestCommandLineInterface:
         """Test that missing required argument causes error."""
         result = subprocess.run([
             sys.executable, "forecast_costs.py"
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode != 0
         assert "required" in result.stderr.lower()
@@ -756,7 +1485,7 @@ class TestIntegrationTests:
             '--date-column', 'PeriodStart',
             '--value-column', 'UnblendedCost',
             '--milestone-summary'
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert '# Forecast Milestone Summary' in result.stdout
@@ -776,7 +1505,7 @@ class TestIntegrationTests:
             '--date-column', 'PeriodStart',
             '--value-column', 'UnblendedCost',
             '--milestone-summary'
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert '# Forecast Milestone Summary' in result.stdout
@@ -800,7 +1529,7 @@ class TestIntegrationTests:
             '--hw-gamma', '0.1',
             '--hw-seasonal-periods', '6',
             '--milestone-summary'
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert '# Forecast Milestone Summary' in result.stdout
@@ -821,7 +1550,7 @@ class TestIntegrationTests:
             '--theta-method', '3',
             '--ensemble',
             '--milestone-summary'
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert '# Forecast Milestone Summary' in result.stdout
@@ -832,6 +1561,116 @@ class TestIntegrationTests:
         assert 'theta:' in result.stdout
         assert 'ensemble:' in result.stdout
 
+    def test_integration_json_output(self):
+        """Test integration with JSON output and milestone summary."""
+        import json
+        test_csv = os.path.join(os.path.dirname(__file__), 'input', 'monthly_costs_simple.csv')
+        result = subprocess.run([
+            sys.executable, 'forecast_costs.py',
+            '--input', test_csv,
+            '--date-column', 'PeriodStart',
+            '--value-column', 'UnblendedCost',
+            '--output-format', 'json',
+            '--milestone-summary'
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
+        
+        assert result.returncode == 0
+        document = json.loads(result.stdout)
+        assert len(document['forecast']) > 29
+        assert document['forecast'][0]['PeriodStart'].startswith('2024-01-01')
+        assert document['forecast'][-1]['sma'] is not None
+        assert 'sma' in document['milestone_summary']['end_of_year']
+
+    def test_integration_group_column(self, tmp_path):
+        """Test --group-column forecasts each group as its own series."""
+        import json
+        import pandas as pd
+        monthly = pd.read_csv(os.path.join(os.path.dirname(__file__), 'input', 'monthly_costs_simple.csv'))
+        grouped = pd.concat([
+            monthly.assign(Service='EC2'),
+            monthly.assign(Service='S3', UnblendedCost=monthly['UnblendedCost'] * 2)
+        ]).iloc[::-1]
+        test_csv = tmp_path / 'grouped.csv'
+        grouped.to_csv(test_csv, index=False)
+        result = subprocess.run([
+            sys.executable, 'forecast_costs.py',
+            '--input', str(test_csv),
+            '--date-column', 'PeriodStart',
+            '--value-column', 'UnblendedCost',
+            '--group-column', 'Service',
+            '--output-format', 'json',
+            '--milestone-summary',
+            '--no-cache'
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
+        
+        assert result.returncode == 0
+        document = json.loads(result.stdout)
+        rows = pd.DataFrame(document['forecast'])
+        assert list(rows.columns[:3]) == ['Service', 'PeriodStart', 'UnblendedCost']
+        sizes = rows.groupby('Service').size()
+        assert sizes['EC2'] == sizes['S3'] == len(monthly) + 12
+        ec2_sma = rows.loc[rows['Service'] == 'EC2', 'sma'].dropna().to_numpy()
+        s3_sma = rows.loc[rows['Service'] == 'S3', 'sma'].dropna().to_numpy()
+        assert s3_sma == pytest.approx(ec2_sma * 2)
+        assert set(document['milestone_summary']) == {'EC2', 'S3'}
+
+    def test_integration_cache_is_isolated(self, tmp_path, isolated_forecast_cache):
+        """Test CLI runs write their caches to the per-test directory, not $HOME."""
+        pytest.importorskip('pyarrow')
+        test_csv = os.path.join(os.path.dirname(__file__), 'input', 'monthly_costs_simple.csv')
+        env = dict(os.environ, HOME=str(tmp_path / 'home'))
+        result = subprocess.run([
+            sys.executable, 'forecast_costs.py',
+            '--input', test_csv,
+            '--date-column', 'PeriodStart',
+            '--value-column', 'UnblendedCost'
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=env)
+        
+        assert result.returncode == 0, result.stderr
+        assert list(isolated_forecast_cache.glob('*.parquet'))
+        assert not (tmp_path / 'home' / '.cache' / 'finops-toolkit').exists()
+    
+    def test_integration_jobs_serial(self):
+        """Test --jobs 1 gives the same forecast as the parallel default."""
+        test_csv = os.path.join(os.path.dirname(__file__), 'input', 'monthly_costs_simple.csv')
+        command = [
+            sys.executable, 'forecast_costs.py',
+            '--input', test_csv,
+            '--date-column', 'PeriodStart',
+            '--value-column', 'UnblendedCost',
+            '--no-cache'
+        ]
+        cwd = os.path.dirname(os.path.dirname(__file__))
+        parallel = subprocess.run(command, capture_output=True, text=True, cwd=cwd, env=dict(os.environ))
+        serial = subprocess.run(command + ['--jobs', '1'], capture_output=True, text=True, cwd=cwd, env=dict(os.environ))
+        
+        assert serial.returncode == 0
+        assert serial.stdout == parallel.stdout
+        
+        invalid = subprocess.run(command + ['--jobs', '0'], capture_output=True, text=True, cwd=cwd, env=dict(os.environ))
+        assert invalid.returncode == 1
+        assert "--jobs" in invalid.stderr
+
+    def test_integration_group_column_too_short(self, tmp_path):
+        """Test a group with too few rows is reported by name."""
+        test_csv = tmp_path / 'grouped.csv'
+        test_csv.write_text(
+            "PeriodStart,Service,UnblendedCost\n"
+            + "".join(f"2024-01-{day:02d},EC2,{day}\n" for day in range(1, 16))
+            + "2024-01-01,S3,1\n"
+        )
+        result = subprocess.run([
+            sys.executable, 'forecast_costs.py',
+            '--input', str(test_csv),
+            '--date-column', 'PeriodStart',
+            '--value-column', 'UnblendedCost',
+            '--group-column', 'Service',
+            '--no-cache'
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
+        
+        assert result.returncode == 3
+        assert "group 'S3'" in result.stderr
+
     def test_integration_missing_values(self):
         """Test integration with data containing missing values."""
         test_csv = os.path.join(os.path.dirname(__file__), 'input', 'costs_with_missing.csv')
@@ -841,7 +1680,7 @@ class TestIntegrationTests:
             '--date-column', 'PeriodStart',
             '--value-column', 'UnblendedCost',
             '--milestone-summary'
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert '# Forecast Milestone Summary' in result.stdout
@@ -856,7 +1695,7 @@ class TestIntegrationTests:
             '--date-column', 'PeriodStart',
             '--value-column', 'UnblendedCost',
             '--milestone-summary'
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert '# Forecast Milestone Summary' in result.stdout
@@ -871,7 +1710,7 @@ class TestIntegrationTests:
             '--date-column', 'PeriodStart',
             '--value-column', 'UnblendedCost',
             '--milestone-summary'
-        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+        ], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)), env=dict(os.environ))
         
         assert result.returncode == 0
         assert '# Forecast Milestone Summary' in result.stdout
@@ -8,6 +8,7 @@ from common.timeseries_transforms import (
     ensure_datetime_column,
     mask_fixed_window_from_start,
     mask_from_start_date,
+    read_input_csv,
     sort_by_date,
 )
 
@@ -102,3 +103,63 @@ def test_append_note_for_first_masked_row_appends_existing():
 
     assert out.loc[5, "note"] == "Existing note\nNew context"
 
+
+
+def test_transforms_do_not_mutate_input():
+    df = _make_df()
+    df = ensure_datetime_column(df, "PeriodStart")
+    df = sort_by_date(df, "PeriodStart")
+
+    mask = mask_from_start_date(df, "PeriodStart", "2025-01-06")
+    out = apply_pct_or_value_change(df, "Cost", mask, pct=-2.0, clamp_non_negative=True)
+    out = append_note_for_first_masked_row(out, "PeriodStart", mask, "Drop to zero")
+
+    assert (df["Cost"] == 100.0).all()
+    assert "note" not in df.columns
+    assert (out.loc[5:, "Cost"] == 0.0).all()
+    assert out.loc[5, "note"] == "Drop to zero"
+
+
+def test_mask_fixed_window_from_start_sorted_and_unsorted():
+    df = _make_df()
+    sorted_mask = mask_fixed_window_from_start(df, "PeriodStart", "2025-01-08", 5)
+    assert sorted_mask.tolist() == [False] * 7 + [True] * 3
+
+    shuffled = df.iloc[::-1].reset_index(drop=True)
+    unsorted_mask = mask_fixed_window_from_start(shuffled, "PeriodStart", "2025-01-08", 2)
+    assert unsorted_mask.tolist() == [True, True] + [False] * 8
+
+
+def test_ensure_datetime_column_reuses_parsed_frame():
+    df = _make_df()
+    assert ensure_datetime_column(df, "PeriodStart") is df
+
+    raw = df.assign(PeriodStart=df["PeriodStart"].dt.strftime("%Y-%m-%d"))
+    parsed = ensure_datetime_column(raw, "PeriodStart")
+    assert parsed["PeriodStart"].equals(df["PeriodStart"])
+    assert raw["PeriodStart"].dtype == object
+
+
+def test_read_input_csv_keeps_all_columns(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("PeriodStart,Cost,Note\n2025-01-01,1.5,a\n2025-01-02,2,\n")
+
+    df = read_input_csv(str(path))
+
+    assert list(df.columns) == ["PeriodStart", "Cost", "Note"]
+    assert df["Cost"].tolist() == [1.5, 2.0]
+    assert df.to_csv(index=False) == "PeriodStart,Cost,Note\n2025-01-01,1.5,a\n2025-01-02,2.0,\n"
+
+
+def test_read_input_csv_keeps_timestamp_text(tmp_path):
+    path = tmp_path / "in.csv"
+    text = (
+        "PeriodStart,Cost,At\n"
+        "2025-01-01 06:00:00,1.5,2025-01-01T06:00:00Z\n"
+        "2025-01-02 06:00:00,2.0,2025-01-02T06:00:00Z\n"
+    )
+    path.write_text(text)
+
+    df = read_input_csv(str(path))
+
+    assert df.to_csv(index=False) == text
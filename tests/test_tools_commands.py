@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 # Tests for the helper commands under tools/.
 
+import io
 import os
 import sys
 import subprocess
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -19,9 +21,40 @@ def run_tool(args):
         cwd=ROOT_DIR,
         capture_output=True,
         text=True,
+        env=dict(os.environ),
     )
 
 
+@pytest.mark.parametrize(
+    "tool_args",
+    [
+        ["tools/add_deep.py", "--start-date", "2025-01-02", "--length", "1", "--value", "10"],
+        ["tools/add_seasonality.py", "--preset", "toys"],
+        ["tools/add_spike.py", "--start-date", "2025-01-02", "--length", "1", "--value", "10"],
+        ["tools/add_spikes.py", "--max-pct", "0.1"],
+        ["tools/add_step_change.py", "--start-date", "2025-01-02", "--pct", "10"],
+        ["tools/filter_forecast_horizon.py", "--output", "-", "--days", "1"],
+        ["tools/generate_series.py", "--pattern", "flat", "--granularity", "daily", "--periods", "3"],
+    ],
+)
+def test_tools_run_without_pythonpath(tmp_path, tool_args):
+    """Every tool runs directly, without the repo root on PYTHONPATH."""
+    input_csv = tmp_path / "input.csv"
+    input_csv.write_text("PeriodStart,Cost,sma\n2025-01-01,100.0,\n2025-01-02,100.0,100.0\n")
+    if tool_args[0] != "tools/generate_series.py":
+        tool_args = tool_args + ["--input", str(input_csv)]
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+    result = subprocess.run(
+        [sys.executable] + tool_args,
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("PeriodStart,Cost")
+
+
 def test_generate_series_daily_flat(tmp_path):
     """generate_series: basic daily flat series with deterministic output."""
     out_csv = tmp_path / "series.csv"
@@ -54,6 +87,86 @@ def test_generate_series_daily_flat(tmp_path):
     assert (df["Cost"] == 100.0).all()
 
 
+def test_generate_series_noise_is_seeded(tmp_path):
+    """generate_series: multiplicative noise follows the fixed seed and is clamped at 0."""
+    out_csv = tmp_path / "series.csv"
+
+    result = run_tool(
+        [
+            "tools/generate_series.py",
+            "--pattern",
+            "flat",
+            "--granularity",
+            "daily",
+            "--periods",
+            "20",
+            "--noise",
+            "2.0",
+            "--start",
+            "2025-01-01",
+            "--out",
+            str(out_csv),
+        ]
+    )
+
+    assert result.returncode == 0, result.stderr
+    df = pd.read_csv(out_csv)
+    noise = np.random.default_rng(42).normal(0.0, 2.0, size=20)
+    expected = np.maximum(100.0 * (1.0 + noise), 0.0)
+    assert np.allclose(df["Cost"].to_numpy(), expected)
+    assert (df["Cost"] == 0.0).any()
+
+
+def test_generate_series_fp32_precision(tmp_path):
+    """generate_series: --precision fp32 writes float32-representable values."""
+    out_csv = tmp_path / "series.csv"
+
+    result = run_tool(
+        [
+            "tools/generate_series.py",
+            "--pattern",
+            "upward_trend",
+            "--granularity",
+            "daily",
+            "--periods",
+            "30",
+            "--precision",
+            "fp32",
+            "--out",
+            str(out_csv),
+        ]
+    )
+
+    assert result.returncode == 0, result.stderr
+    values = pd.read_csv(out_csv, dtype={"Cost": str})["Cost"]
+    assert len(values) == 30
+    # Each value is written as the shortest repr of a float32
+    assert all(str(np.float32(text)) == text for text in values)
+
+
+def test_generate_series_fast_csv_format(tmp_path):
+    """generate_series: default output is pandas' to_csv; --fast-csv pins pyarrow's number format."""
+    def generate(baseline, *extra):
+        return run_tool([
+            "tools/generate_series.py", "--pattern", "flat", "--granularity", "daily",
+            "--periods", "2", "--baseline", baseline, "--noise", "0.0", "--start", "2025-01-01",
+        ] + list(extra))
+
+    default = generate("0.00001")
+    assert default.returncode == 0, default.stderr
+    assert default.stdout.splitlines() == ["PeriodStart,Cost", "2025-01-01,1e-05", "2025-01-02,1e-05"]
+
+    pytest.importorskip("pyarrow")
+    fast = generate("0.00001", "--fast-csv")
+    assert fast.returncode == 0, fast.stderr
+    assert fast.stdout.splitlines() == ["PeriodStart,Cost", "2025-01-01,0.00001", "2025-01-02,0.00001"]
+
+    out_csv = tmp_path / "series.csv"
+    fast_file = generate("100", "--precision", "fp32", "--fast-csv", "--out", str(out_csv))
+    assert fast_file.returncode == 0, fast_file.stderr
+    assert out_csv.read_text().splitlines() == ["PeriodStart,Cost", "2025-01-01,100", "2025-01-02,100"]
+
+
 def _write_simple_cost_series(tmp_path, filename="input.csv", days=5, value=100.0):
     dates = pd.date_range("2025-01-01", periods=days, freq="D")
     df = pd.DataFrame({"PeriodStart": dates, "Cost": value})
@@ -201,6 +314,176 @@ def test_add_spikes_max_pct_bounds(tmp_path):
     assert df["Cost"].max() > 100.0
 
 
+def test_add_spikes_streams_multiple_chunks_to_stdout(tmp_path):
+    """add_spikes: inputs longer than one chunk keep every row and a single header."""
+    input_csv = tmp_path / "hourly.csv"
+    pd.DataFrame({
+        "PeriodStart": pd.date_range("2000-01-01", periods=250_000, freq="h"),
+        "Cost": 100.0,
+    }).to_csv(input_csv, index=False)
+
+    result = run_tool(
+        [
+            "tools/add_spikes.py",
+            "--input",
+            str(input_csv),
+            "--max-pct",
+            "0.10",
+            "--prob",
+            "0.5",
+        ]
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.count("PeriodStart") == 1
+    df = pd.read_csv(io.StringIO(result.stdout))
+    assert len(df) == 250_000
+    assert (df["Cost"] >= 100.0).all()
+    assert (df["Cost"] <= 110.0 + 1e-9).all()
+    assert (df["Cost"] > 100.0).any()
+
+
+def test_add_spikes_passthrough_columns_consistent_across_chunks(tmp_path):
+    """add_spikes: passthrough columns keep their text in every chunk, even with a gap in a later one."""
+    rows = 250_000
+    input_csv = tmp_path / "hourly.csv"
+    ids = [str(i) for i in range(rows)]
+    ids[200_000] = ""
+    pd.DataFrame({
+        "PeriodStart": pd.date_range("2000-01-01", periods=rows, freq="h"),
+        "Cost": 100.0,
+        "Id": ids,
+    }).to_csv(input_csv, index=False)
+
+    result = run_tool(["tools/add_spikes.py", "--input", str(input_csv), "--max-pct", "0.10", "--prob", "0"])
+
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert len(lines) == rows + 1
+    assert lines[1].endswith(",100.0,0")
+    assert lines[100_001].endswith(",100.0,100000")
+    assert lines[200_001].endswith(",100.0,")
+    assert lines[200_002].endswith(",100.0,200001")
+    assert lines[-1].endswith(f",100.0,{rows - 1}")
+
+
+def test_filter_forecast_horizon_unsorted_input(tmp_path):
+    """filter_forecast_horizon: grouped (unsorted) forecast files keep every row in the horizon."""
+    dates = pd.date_range("2025-01-01", periods=6, freq="D")
+    group = pd.DataFrame({"PeriodStart": dates, "Cost": 100.0, "sma": [float("nan")] * 3 + [200.0] * 3})
+    input_csv = tmp_path / "grouped.csv"
+    out_csv = tmp_path / "filtered.csv"
+    pd.concat([group.assign(Service="EC2"), group.assign(Service="S3")]).to_csv(input_csv, index=False)
+
+    result = run_tool(
+        [
+            "tools/filter_forecast_horizon.py",
+            "--input",
+            str(input_csv),
+            "--output",
+            str(out_csv),
+            "--days",
+            "2",
+        ]
+    )
+
+    assert result.returncode == 0, result.stderr
+    df = pd.read_csv(out_csv)
+    assert df["Service"].tolist() == ["EC2", "EC2", "S3", "S3"]
+    assert df["PeriodStart"].tolist() == ["2025-01-04", "2025-01-05"] * 2
+
+
+def test_filter_forecast_horizon_writes_stdout(tmp_path):
+    """filter_forecast_horizon: --output - streams CSV to stdout and reports on stderr."""
+    dates = pd.date_range("2025-01-01", periods=6, freq="D")
+    input_csv = tmp_path / "forecasts.csv"
+    pd.DataFrame(
+        {
+            "PeriodStart": dates,
+            "Cost": 100.0,
+            "sma": [float("nan")] * 3 + [200.0] * 3,
+        }
+    ).to_csv(input_csv, index=False)
+
+    result = run_tool(
+        [
+            "tools/filter_forecast_horizon.py",
+            "--input",
+            str(input_csv),
+            "--output",
+            "-",
+            "--days",
+            "2",
+        ]
+    )
+
+    assert result.returncode == 0, result.stderr
+    df = pd.read_csv(io.StringIO(result.stdout))
+    assert pd.to_datetime(df["PeriodStart"]).tolist() == list(dates[3:5])
+    assert "Wrote 2 rows to stdout" in result.stderr
+
+
+def _write_horizon_input(tmp_path, dates):
+    input_csv = tmp_path / "forecasts.csv"
+    pd.DataFrame(
+        {
+            "PeriodStart": dates,
+            "Cost": [100.0, 2.5, 1e-05, 7.0, 0.1, 3.0],
+            "sma": [float("nan")] * 3 + [200.0, 1.5, float("nan")],
+        }
+    ).to_csv(input_csv, index=False)
+    return input_csv
+
+
+def _filter_horizon(input_csv, output, engine=None):
+    args = ["tools/filter_forecast_horizon.py", "--input", str(input_csv), "--output", output, "--days", "2"]
+    if engine:
+        args += ["--engine", engine]
+    return run_tool(args)
+
+
+def test_filter_forecast_horizon_pandas_engine_is_default(tmp_path):
+    """filter_forecast_horizon: pandas writes the output unless --engine polars is given."""
+    input_csv = _write_horizon_input(tmp_path, pd.date_range("2025-01-01", periods=6, freq="D"))
+
+    default = _filter_horizon(input_csv, "-")
+    forced = _filter_horizon(input_csv, "-", engine="pandas")
+
+    assert default.returncode == 0, default.stderr
+    assert forced.returncode == 0, forced.stderr
+    assert default.stdout == forced.stdout
+    assert default.stdout.splitlines() == ["PeriodStart,Cost,sma", "2025-01-04,7.0,200.0", "2025-01-05,0.1,1.5"]
+
+
+@pytest.mark.parametrize("freq", ["D", "6h"])
+def test_filter_forecast_horizon_polars_matches_pandas(tmp_path, freq):
+    """filter_forecast_horizon: --engine polars writes the same rows, dates and timestamps as pandas."""
+    pytest.importorskip("polars")
+    dates = pd.date_range("2025-01-01 06:00" if freq == "6h" else "2025-01-01", periods=6, freq=freq)
+    input_csv = _write_horizon_input(tmp_path, dates)
+
+    for output in ["-", str(tmp_path / "out.csv")]:
+        results = {engine: _filter_horizon(input_csv, output, engine) for engine in ["pandas", "polars"]}
+        texts = {}
+        for engine, result in results.items():
+            assert result.returncode == 0, result.stderr
+            texts[engine] = result.stdout if output == "-" else open(output).read()
+        assert texts["polars"] == texts["pandas"]
+
+
+def test_filter_forecast_horizon_polars_float_format(tmp_path):
+    """filter_forecast_horizon: pins the one known polars difference, positional small floats."""
+    pytest.importorskip("polars")
+    input_csv = tmp_path / "forecasts.csv"
+    input_csv.write_text("PeriodStart,Cost,sma\n2025-01-01,1e-05,2.5e-07\n")
+
+    pandas_result = _filter_horizon(input_csv, "-", engine="pandas")
+    polars_result = _filter_horizon(input_csv, "-", engine="polars")
+
+    assert pandas_result.stdout.splitlines()[1] == "2025-01-01,1e-05,2.5e-07"
+    assert polars_result.stdout.splitlines()[1] == "2025-01-01,0.00001,2.5e-7"
+
+
 def test_add_seasonality_preset_toys(tmp_path):
     """add_seasonality: applies expected monthly factors for preset 'toys'."""
     dates = pd.date_range("2025-01-01", periods=12, freq="MS")
@@ -239,6 +522,52 @@ def test_add_seasonality_preset_toys(tmp_path):
     assert dec == pytest.approx(140.0)
 
 
+def test_add_seasonality_custom_factors_daily(tmp_path):
+    """add_seasonality: scales every day by its month's custom factor."""
+    dates = pd.date_range("2024-12-30", periods=5, freq="D")
+    df_in = pd.DataFrame({"PeriodStart": dates, "Cost": 10.0})
+    input_csv = tmp_path / "daily.csv"
+    out_csv = tmp_path / "daily_custom.csv"
+    df_in.to_csv(input_csv, index=False)
+    factors = ",".join(str(1.0 + month / 10) for month in range(12))
+
+    result = run_tool(
+        [
+            "tools/add_seasonality.py",
+            "--input",
+            str(input_csv),
+            "--output",
+            str(out_csv),
+            "--factors",
+            factors,
+        ]
+    )
+
+    assert result.returncode == 0, result.stderr
+    df = pd.read_csv(out_csv)
+    # Dec 30-31 use the December factor (2.1), Jan 1-3 the January factor (1.0)
+    assert df["Cost"].tolist() == pytest.approx([21.0, 21.0, 10.0, 10.0, 10.0])
+
+
+def test_add_seasonality_keeps_timestamp_text(tmp_path):
+    """add_seasonality: timestamp and time columns are written back exactly as read."""
+    input_csv = tmp_path / "timestamps.csv"
+    input_csv.write_text(
+        "PeriodStart,Cost,At\n"
+        "2024-01-01T00:00:00Z,100,12:00\n"
+        "2024-02-01T00:00:00Z,100,13:00\n"
+    )
+
+    result = run_tool(["tools/add_seasonality.py", "--input", str(input_csv), "--preset", "toys"])
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == (
+        "PeriodStart,Cost,At\n"
+        "2024-01-01T00:00:00Z,95.0,12:00\n"
+        "2024-02-01T00:00:00Z,95.0,13:00\n"
+    )
+
+
 def test_filter_forecast_horizon_keeps_expected_rows(tmp_path):
     """filter_forecast_horizon: keeps only N days from first forecast date."""
     dates = pd.date_range("2025-01-01", periods=10, freq="D")
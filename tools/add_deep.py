@@ -19,16 +19,12 @@ Examples:
 """
 
 import argparse
+import os
+import sys
 
-from common.timeseries_transforms import (
-    apply_pct_or_value_change,
-    append_note_for_first_masked_row,
-    ensure_datetime_column,
-    mask_fixed_window_from_start,
-    read_input_csv,
-    sort_by_date,
-    write_output_csv,
-)
+# The repo root is put on the path so the tool also runs directly
+# (python tools/<tool>.py) without PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 def parse_args() -> argparse.Namespace:
@@ -53,7 +49,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--pct",
         type=float,
-        help="Positive fractional percentage change (e.g., 0.3 = -30%)",
+        help="Positive fractional percentage change (e.g., 0.3 = -30%%)",
     )
     parser.add_argument(
         "--value",
@@ -70,6 +66,16 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
 
+    from common.timeseries_transforms import (
+        apply_pct_or_value_change,
+        append_note_for_first_masked_row,
+        ensure_datetime_column,
+        mask_fixed_window_from_start,
+        read_input_csv,
+        sort_by_date,
+        write_output_csv,
+    )
+
     if args.pct is not None and args.pct <= 0:
         raise SystemExit("--pct must be > 0 for add_deep")
     if args.value is not None and args.value <= 0:
@@ -22,10 +22,15 @@ Examples:
 """
 
 import argparse
+import os
 import sys
-import pandas as pd
+import numpy as np
 from typing import List
 
+# The repo root is put on the path so the tool also runs directly
+# (python tools/<tool>.py) without PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Apply monthly multiplicative seasonality to a CSV series")
@@ -38,39 +43,52 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def get_preset_factors(name: str) -> List[float]:
-    if name == "toys":
-        # Neutral most of the year, ramp in Nov/Dec
-        return [
-            0.95, 0.95, 0.97, 0.98, 1.00, 1.02,
-            1.03, 1.05, 1.07, 1.10, 1.30, 1.40
-        ]
-    if name == "holidays":
-        # Peaks in Aug, Dec, and smaller bump in Feb
-        return [
-            1.00, 1.08, 1.00, 0.98, 0.97, 0.98,
-            1.00, 1.15, 1.02, 1.03, 1.05, 1.20
-        ]
-    raise ValueError(f"Unknown preset: {name}")
+def _preset(values: List[float]) -> np.ndarray:
+    factors = np.asarray(values, dtype=np.float64)
+    factors.flags.writeable = False
+    return factors
+
+
+PRESET_FACTORS = {
+    # Neutral most of the year, ramp in Nov/Dec
+    "toys": _preset([
+        0.95, 0.95, 0.97, 0.98, 1.00, 1.02,
+        1.03, 1.05, 1.07, 1.10, 1.30, 1.40
+    ]),
+    # Peaks in Aug, Dec, and smaller bump in Feb
+    "holidays": _preset([
+        1.00, 1.08, 1.00, 0.98, 0.97, 0.98,
+        1.00, 1.15, 1.02, 1.03, 1.05, 1.20
+    ]),
+}
+
+
+def get_preset_factors(name: str) -> np.ndarray:
+    try:
+        return PRESET_FACTORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown preset: {name}")
 
 
-def parse_factors(s: str) -> List[float]:
+def parse_factors(s: str) -> np.ndarray:
     parts = [p.strip() for p in s.split(",") if p.strip()]
     if len(parts) != 12:
         raise SystemExit("--factors must specify exactly 12 comma-separated numbers for Jan..Dec")
     try:
-        return [float(p) for p in parts]
+        return np.array(parts, dtype=np.float64)
     except ValueError:
         raise SystemExit("--factors contains non-numeric value(s)")
 
 
 def main() -> None:
     args = parse_args()
+
+    import pandas as pd
+
+    from common.timeseries_transforms import read_input_csv, write_output_csv
+
     # Read input
-    if args.input:
-        df = pd.read_csv(args.input)
-    else:
-        df = pd.read_csv(sys.stdin)
+    df = read_input_csv(args.input)
 
     if args.value_column not in df.columns:
         raise SystemExit(f"Missing value column: {args.value_column}")
@@ -89,15 +107,12 @@ def main() -> None:
     if dates.isna().any():
         raise SystemExit(f"Invalid dates found in column {args.date_column}")
 
-    month_idx = dates.dt.month - 1  # 0..11
-    scale = month_idx.map(lambda m: factors[int(m)])
+    month_idx = dates.dt.month.to_numpy() - 1  # 0..11
+    scale = factors[month_idx]
 
-    df[args.value_column] = df[args.value_column].astype(float) * scale.to_numpy(dtype=float)
+    df[args.value_column] = df[args.value_column].to_numpy(dtype=float) * scale
 
-    if args.output:
-        df.to_csv(args.output, index=False)
-    else:
-        df.to_csv(sys.stdout, index=False)
+    write_output_csv(df, args.output)
 
 
 if __name__ == "__main__":
@@ -11,47 +11,81 @@ Examples:
 """
 
 import argparse
+import os
 import sys
+from collections import defaultdict
 import numpy as np
-import pandas as pd
+
+# The repo root is put on the path so the tool also runs directly
+# (python tools/<tool>.py) without PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cli_utils import write_csv_output
+
+# Rows per chunk; memory stays bounded by the chunk, not the file
+CHUNK_ROWS = 100_000
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Add bounded positive spikes to a CSV series")
     parser.add_argument("--input", help="Path to input CSV (if omitted, reads from stdin)")
-    parser.add_argument("--output", help="Path to output CSV (if omitted, writes to stdout)")
-    parser.add_argument("--max-pct", type=float, required=True, help="Maximum spike magnitude as fraction (e.g., 0.10 = 10%)")
+    parser.add_argument("--output", help="Path to output CSV (if omitted or '-', writes to stdout)")
+    parser.add_argument("--max-pct", type=float, required=True, help="Maximum spike magnitude as fraction (e.g., 0.10 = 10%%)")
     parser.add_argument("--prob", type=float, default=0.05, help="Daily probability of a spike (0..1)")
     parser.add_argument("--date-column", default="PeriodStart", help="Date column name")
     parser.add_argument("--value-column", default="Cost", help="Value column name to spike")
     parser.add_argument("--seed", type=int, default=42, help="Random seed for determinism")
+    parser.add_argument("--precision", choices=["fp32", "fp64"], default="fp64",
+                        help="Precision of the written values (default: fp64); fp32 roughly halves the CSV size")
     return parser.parse_args()
 
 
+def spike_values(values: np.ndarray, rng: np.random.Generator, prob: float, max_pct: float) -> None:
+    """Scale a random `prob` share of values in place by up to `max_pct`."""
+    idx = np.flatnonzero(rng.random(values.shape[0]) < prob)
+    values[idx] *= 1.0 + rng.uniform(0.0, max_pct, size=idx.size)
+
+
 def main() -> None:
     args = parse_args()
+
+    # pandas is imported after argument parsing so --help stays quick
+    import pandas as pd
+
     rng = np.random.default_rng(args.seed)
 
-    # Read input DataFrame
-    if args.input:
-        df = pd.read_csv(args.input)
-    else:
-        df = pd.read_csv(sys.stdin)
-    if args.value_column not in df.columns:
-        raise SystemExit(f"Missing value column: {args.value_column}")
-
-    values = df[args.value_column].to_numpy(dtype=float)
-    mask = rng.random(values.shape[0]) < args.prob
-    multipliers = 1.0 + rng.uniform(0.0, args.max_pct, size=values.shape[0])
-
-    spiked = values.copy()
-    spiked[mask] = values[mask] * multipliers[mask]
-    df[args.value_column] = spiked
-
-    if args.output:
-        df.to_csv(args.output, index=False)
-    else:
-        df.to_csv(sys.stdout, index=False)
+    # Stream the input so large files never need to fit in memory; one seeded
+    # generator across chunks keeps the output deterministic
+    source = args.input if args.input else sys.stdin
+    dtype = np.float32 if args.precision == "fp32" else np.float64
+    # Each chunk infers its own column types, so an int column with a gap in
+    # a later chunk would switch to floats mid-file. Only the value column is
+    # parsed; the other columns are passed through as the text that was read
+    dtypes = defaultdict(lambda: str, {args.value_column: np.float64})
+    out = None
+    try:
+        with pd.read_csv(source, chunksize=CHUNK_ROWS, dtype=dtypes) as reader:
+            for i, chunk in enumerate(reader):
+                if args.value_column not in chunk.columns:
+                    raise SystemExit(f"Missing value column: {args.value_column}")
+
+                # Spike the chunk's own float buffer in place; copy only when
+                # the column needs a cast or pandas hands back a read-only view
+                values = chunk[args.value_column].to_numpy(dtype=dtype)
+                if not values.flags.writeable:
+                    values = values.copy()
+                spike_values(values, rng, args.prob, args.max_pct)
+                chunk[args.value_column] = values
+
+                if not args.output or args.output == "-":
+                    write_csv_output(chunk, include_header=(i == 0))
+                    continue
+                if out is None:
+                    out = open(args.output, "w", newline="")
+                chunk.to_csv(out, index=False, header=(i == 0))
+    finally:
+        if out is not None:
+            out.close()
 
 
 if __name__ == "__main__":
@@ -18,17 +18,13 @@ Examples:
 """
 
 import argparse
+import os
+import sys
 from typing import Optional
 
-from common.timeseries_transforms import (
-    apply_pct_or_value_change,
-    append_note_for_first_masked_row,
-    ensure_datetime_column,
-    mask_from_start_date,
-    read_input_csv,
-    sort_by_date,
-    write_output_csv,
-)
+# The repo root is put on the path so the tool also runs directly
+# (python tools/<tool>.py) without PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 def parse_args() -> argparse.Namespace:
@@ -45,7 +41,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--pct",
         type=float,
-        help="Fractional percentage change (e.g., 0.5 = +50%, -0.2 = -20%)",
+        help="Fractional percentage change (e.g., 0.5 = +50%%, -0.2 = -20%%)",
     )
     parser.add_argument(
         "--value",
@@ -62,6 +58,16 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
 
+    from common.timeseries_transforms import (
+        apply_pct_or_value_change,
+        append_note_for_first_masked_row,
+        ensure_datetime_column,
+        mask_from_start_date,
+        read_input_csv,
+        sort_by_date,
+        write_output_csv,
+    )
+
     df = read_input_csv(args.input)
     df = ensure_datetime_column(df, args.date_column)
     df = sort_by_date(df, args.date_column)
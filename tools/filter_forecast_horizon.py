@@ -4,17 +4,28 @@ Filter a forecast CSV to keep only the initial forecast horizon (next N days).
 
 Assumes the CSV contains historical actuals followed by forecast rows (where
 at least one forecast column is non-null). The script finds the first forecast
-date, then keeps rows from that date up to N days after.
+date, then keeps rows from that date up to N days after. pandas is used by
+default; --engine polars scans the file lazily with polars instead.
 
 Input CSV schema (default): PeriodStart, Cost, [forecast columns]
 
 Examples:
   python tools/filter_forecast_horizon.py --input demo/out/daily_flat_forecasts.csv --output demo/out/daily_flat_next_month.csv --days 30
   python tools/filter_forecast_horizon.py --input demo/out/daily_growth_forecasts.csv --output demo/out/daily_growth_next_year.csv --days 365
+  python tools/filter_forecast_horizon.py --input demo/out/daily_flat_forecasts.csv --output - --days 30 | head
+  python tools/filter_forecast_horizon.py --input demo/out/daily_growth_forecasts.csv --output - --days 365 --engine polars
 """
 
 import argparse
-import pandas as pd
+import os
+import sys
+from datetime import timedelta
+
+# The repo root is put on the path so the tool also runs directly
+# (python tools/<tool>.py) without PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cli_utils import write_csv_output
 
 
 FORECAST_COLS = [
@@ -34,33 +45,112 @@ FORECAST_COLS = [
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Filter forecast CSV by horizon (days)")
     parser.add_argument("--input", required=True, help="Path to input forecast CSV")
-    parser.add_argument("--output", required=True, help="Path to output CSV")
+    parser.add_argument("--output", required=True, help="Path to output CSV ('-' writes to stdout)")
     parser.add_argument("--days", type=int, required=True, help="Number of days to keep starting from first forecast date")
     parser.add_argument("--date-column", default="PeriodStart", help="Date column name")
+    parser.add_argument("--engine", choices=["pandas", "polars"], default="pandas",
+                        help="CSV engine (default: pandas). polars (requires polars) scans the file lazily and is "
+                             "faster on large files, but writes small floats positionally (0.00001 rather than 1e-05)")
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_args()
-    df = pd.read_csv(args.input)
+def filter_with_polars(args: argparse.Namespace) -> int:
+    """Filter with a polars lazy scan (no intermediate pandas frame); returns rows written.
+
+    Dates and timestamps are written the way the pandas path writes them;
+    floats use polars' own formatting.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        raise SystemExit("polars is not installed; install it or use --engine pandas")
+
+    # ISO dates load as pl.Date, so they are written back as YYYY-MM-DD
+    lf = pl.scan_csv(args.input, try_parse_dates=True)
+    schema = lf.collect_schema()
+    if args.date_column not in schema:
+        raise SystemExit(f"Missing date column: {args.date_column}")
+    forecast_cols = [col for col in FORECAST_COLS if col in schema]
+    if not forecast_cols:
+        raise SystemExit("No forecast columns found in CSV")
+
+    date = pl.col(args.date_column)
+    if schema[args.date_column] == pl.String:
+        lf = lf.with_columns(date.str.to_datetime())
+    start = (
+        lf.filter(pl.any_horizontal([pl.col(col).is_not_null() for col in forecast_cols]))
+        .select(date.min())
+        .collect()
+        .item()
+    )
+    if start is None:
+        raise SystemExit("No forecast rows found in CSV")
+
+    end = start + timedelta(days=args.days)
+    focused = lf.filter((date >= start) & (date < end)).collect()
+    # Match pandas' "YYYY-MM-DD HH:MM:SS" rather than polars' ISO default
+    datetime_format = "%Y-%m-%d %H:%M:%S"
+    if args.output == "-":
+        sys.stdout.flush()
+        focused.write_csv(sys.stdout.buffer, datetime_format=datetime_format)
+    else:
+        focused.write_csv(args.output, datetime_format=datetime_format)
+    return focused.height
+
+
+def filter_with_pandas(args: argparse.Namespace) -> int:
+    """Filter with pandas; returns rows written."""
+    # Imported here so the polars path never pays for pandas
+    import pandas as pd
+
+    from common.timeseries_transforms import read_input_csv
+
+    df = read_input_csv(args.input)
     if args.date_column not in df.columns:
         raise SystemExit(f"Missing date column: {args.date_column}")
 
-    df[args.date_column] = pd.to_datetime(df[args.date_column])
-    if not set(FORECAST_COLS) & set(df.columns):
+    try:
+        # forecast_costs writes ISO dates; the explicit format skips inference
+        df[args.date_column] = pd.to_datetime(df[args.date_column], format="ISO8601", cache=True)
+    except ValueError:
+        df[args.date_column] = pd.to_datetime(df[args.date_column])
+    forecast_cols = [col for col in FORECAST_COLS if col in df.columns]
+    if not forecast_cols:
         raise SystemExit("No forecast columns found in CSV")
 
-    forecast_cols = list(set(FORECAST_COLS) & set(df.columns))
-    forecast_only = df[df[forecast_cols].notna().any(axis=1)].copy()
-    if forecast_only.empty:
+    # One boolean per row instead of a filtered copy of the forecast rows
+    has_forecast = df[forecast_cols].notna().to_numpy().any(axis=1)
+    if not has_forecast.any():
         raise SystemExit("No forecast rows found in CSV")
 
-    start = forecast_only[args.date_column].min()
+    start = df[args.date_column].to_numpy()[has_forecast].min()
     end = start + pd.Timedelta(days=args.days)
-    focused = df[(df[args.date_column] >= start) & (df[args.date_column] < end)]
+    dates = df[args.date_column]
+    if dates.is_monotonic_increasing:
+        # Sorted dates: the horizon is one contiguous block of rows
+        lo, hi = dates.searchsorted(pd.DatetimeIndex([start, end]), side="left")
+        focused = df.iloc[lo:hi]
+    else:
+        focused = df[(dates >= start) & (dates < end)]
 
-    focused.to_csv(args.output, index=False)
-    print(f"Wrote {len(focused)} rows to {args.output}")
+    if args.output == "-":
+        write_csv_output(focused)
+    else:
+        focused.to_csv(args.output, index=False)
+    return len(focused)
+
+
+def main() -> None:
+    args = parse_args()
+    if args.engine == "polars":
+        rows = filter_with_polars(args)
+    else:
+        rows = filter_with_pandas(args)
+    # Keep stdout clean when it carries the CSV
+    if args.output == "-":
+        print(f"Wrote {rows} rows to stdout", file=sys.stderr)
+    else:
+        print(f"Wrote {rows} rows to {args.output}")
 
 
 if __name__ == "__main__":
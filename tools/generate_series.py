@@ -14,12 +14,13 @@ Patterns:
   - flat: constant baseline with noise
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
 from datetime import datetime
 import numpy as np
-import pandas as pd
-from typing import Optional
+from typing import Callable, Optional
 
 
 def parse_args() -> argparse.Namespace:
@@ -31,7 +32,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--periods", type=int, default=36)
     parser.add_argument("--baseline", type=float, default=100.0)
     parser.add_argument("--trend", type=float, default=1.0, help="Per-period change (use negative for downward)")
-    parser.add_argument("--noise", type=float, default=0.05, help="Relative noise level, e.g., 0.05 = 5%")
+    parser.add_argument("--noise", type=float, default=0.05, help="Relative noise level, e.g., 0.05 = 5%%")
     parser.add_argument("--step-index", type=int, default=None, help="Index of step change (0-based)")
     parser.add_argument("--step-size", type=float, default=50.0, help="Magnitude of step change")
     parser.add_argument("--spike-index", type=int, default=None, help="Index of spike (0-based)")
@@ -41,10 +42,19 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--start", default=None, help="Start date (YYYY-MM-DD). Defaults to calculated start to end today.")
     parser.add_argument("--end-date", default=None, help="End date (YYYY-MM-DD). Defaults to today. If specified, start date is calculated backwards from end date.")
     parser.add_argument("--out", required=False, help="Output CSV path (if omitted, writes CSV to stdout)")
+    parser.add_argument("--precision", choices=["fp32", "fp64"], default="fp64",
+                        help="Precision of generated values (default: fp64). fp32 writes ~7 significant digits, "
+                             "about half the CSV size; it draws a different noise sequence than fp64")
+    parser.add_argument("--fast-csv", action="store_true",
+                        help="Write the CSV with pyarrow's C writer (much faster for long series). Numbers are "
+                             "formatted differently from the default writer: whole floats lose the trailing .0 "
+                             "and small values are not written in exponent form (1e-05 becomes 0.00001)")
     return parser.parse_args()
 
 
 def generate_dates(start_str: Optional[str], end_str: Optional[str], periods: int, granularity: str) -> pd.DatetimeIndex:
+    import pandas as pd
+
     if start_str:
         start = pd.to_datetime(start_str)
     elif end_str:
@@ -53,7 +63,7 @@ def generate_dates(start_str: Optional[str], end_str: Optional[str], periods: in
         if granularity == "monthly":
             start = end - pd.DateOffset(months=periods-1)
         else:
-            start = end - pd.DateOffset(days=periods-1)
+            start = end - pd.Timedelta(days=periods-1)
     else:
         # End today instead of starting today
         today = pd.Timestamp.today().normalize()
@@ -61,38 +71,116 @@ def generate_dates(start_str: Optional[str], end_str: Optional[str], periods: in
         if granularity == "monthly":
             start = today.replace(day=1) - pd.DateOffset(months=periods-1)
         else:
-            start = today - pd.DateOffset(days=periods-1)
+            start = today - pd.Timedelta(days=periods-1)
     freq = "MS" if granularity == "monthly" else "D"
     return pd.date_range(start=start, periods=periods, freq=freq)
 
 
-def build_series(args: argparse.Namespace) -> np.ndarray:
-    n = args.periods
-    rng = np.random.default_rng(42)
-    noise_scale = args.noise
-    values = np.full(n, args.baseline, dtype=float)
+def make_pattern_fn(args: argparse.Namespace) -> Optional[Callable[[np.ndarray], None]]:
+    """Return a function adding the pattern to a baseline buffer in place.
 
-    if args.pattern == "upward_trend":
-        values += np.arange(n) * abs(args.trend)
-    elif args.pattern == "downward_trend":
-        values += np.arange(n) * (-abs(args.trend))
-    elif args.pattern == "step_change":
+    Returns None when the pattern adds nothing (flat, or a zero trend, step or
+    spike), so build_series can skip that pass entirely.
+    """
+    n = args.periods
+    if args.pattern in ("upward_trend", "downward_trend"):
+        slope = abs(args.trend) if args.pattern == "upward_trend" else -abs(args.trend)
+        if slope == 0:
+            return None
+
+        def add_trend(values: np.ndarray) -> None:
+            # One float buffer for the ramp, scaled in place
+            ramp = np.arange(n, dtype=np.float64)
+            ramp *= slope
+            values += ramp
+        return add_trend
+    if args.pattern == "step_change":
         idx = args.step_index if args.step_index is not None else n // 2
-        values[idx:] += args.step_size
-    elif args.pattern == "spike":
+        if args.step_size == 0:
+            return None
+
+        def add_step(values: np.ndarray) -> None:
+            values[idx:] += args.step_size
+        return add_step
+    if args.pattern == "spike":
         idx = args.spike_index if args.spike_index is not None else n // 3
-        values[idx] += args.spike_size
-    elif args.pattern == "flat":
-        pass
+        if args.spike_size == 0:
+            return None
+
+        def add_spike(values: np.ndarray) -> None:
+            values[idx] += args.spike_size
+        return add_spike
+    return None
 
-    # Add multiplicative noise
-    noise = rng.normal(0.0, noise_scale, size=n)
-    values = values * (1.0 + noise)
-    return np.maximum(values, 0.0)
+
+def build_series(args: argparse.Namespace) -> np.ndarray:
+    n = args.periods
+    rng = np.random.default_rng(42)
+    noise_scale = args.noise
+    dtype = np.float32 if args.precision == "fp32" else np.float64
+    values = np.full(n, args.baseline, dtype=dtype)
+
+    pattern_fn = make_pattern_fn(args)
+    if pattern_fn is not None:
+        pattern_fn(values)
+
+    if noise_scale == 0:
+        return np.maximum(values, 0.0, out=values)
+
+    # Add multiplicative noise and clamp at zero, reusing the two buffers
+    # instead of allocating a temporary per operation
+    noise = rng.standard_normal(n, dtype=dtype)
+    noise *= noise_scale
+    noise += 1.0
+    values *= noise
+    return np.maximum(values, 0.0, out=values)
+
+
+def write_csv(df: pd.DataFrame, date_column: str, path: Optional[str], fast: bool = False) -> None:
+    """Write the series as CSV to path (or stdout).
+
+    By default this is DataFrame.to_csv. With fast=True, pyarrow's C writer is
+    used instead. It formats numbers its own way: whole floats have no ".0"
+    (100 rather than 100.0) and small values are written in positional or
+    shorter exponent form (0.00001 rather than 1e-05, 2.5e-7 rather than
+    2.5e-07). The fast path needs pyarrow and midnight dates (written as
+    YYYY-MM-DD); otherwise it falls back to to_csv.
+    """
+    dates = df[date_column]
+    pa = None
+    if fast:
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            print("pyarrow is not installed; writing with pandas instead of --fast-csv", file=sys.stderr)
+    if pa is None or not (dates == dates.dt.normalize()).all():
+        df.to_csv(path if path else sys.stdout, index=False)
+        return
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    position = table.schema.get_field_index(date_column)
+    table = table.set_column(position, date_column, table.column(position).cast(pa.date32()))
+    # pyarrow always quotes the header, so pandas writes that line
+    header = df.head(0).to_csv(index=False).encode()
+    options = pa_csv.WriteOptions(include_header=False, quoting_style="none")
+    if path:
+        with open(path, "wb") as out:
+            out.write(header)
+            pa_csv.write_csv(table, out, write_options=options)
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(header)
+        pa_csv.write_csv(table, sys.stdout.buffer, write_options=options)
+        sys.stdout.buffer.flush()
 
 
 def main() -> None:
     args = parse_args()
+
+    # pandas is imported after argument parsing so --help stays quick
+    import pandas as pd
+
     dates = generate_dates(args.start, args.end_date, args.periods, args.granularity)
     series = build_series(args)
 
@@ -101,11 +189,8 @@ def main() -> None:
         args.value_column: series
     })
 
-    if args.out:
-        df.to_csv(args.out, index=False)
-        # Avoid noisy stdout when used in pipes
-    else:
-        df.to_csv(sys.stdout, index=False)
+    # Writes nothing else to stdout so the CSV can be piped
+    write_csv(df, args.date_column, args.out, fast=args.fast_csv)
 
 
 if __name__ == "__main__":